@@ -1,7 +1,12 @@
 # my-facade-api/src/presentation/collateral_blueprint.py
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from src.domain.collateral.services import get_collateral_overview, patch_collateral_overview, get_collateral_fields
+from src.adapters.serialization import model_response
 from pydantic import ValidationError
+from functools import lru_cache
+from typing import Optional, Union
+import hashlib
+import json
 import yaml
 from src.domain.collateral.models import TransactionData, CollateralItem, CollateralOverview, CollateralPatchSuccess, CollateralPatchFailure
 
@@ -11,7 +16,7 @@ collateral_bp = Blueprint('collateral', __name__, url_prefix='/collateral')
 def get_collateral_overview_endpoint(location_id):
     result, status_code = get_collateral_overview(location_id)
     if status_code == 200:
-        return jsonify(result.dict()), status_code
+        return model_response(result, status_code)
     return jsonify(result), status_code
 
 @collateral_bp.route('/collateralOverview/<int:location_id>', methods=['PATCH'])
@@ -19,7 +24,7 @@ def patch_collateral_overview_endpoint(location_id):
     data = request.get_json()
     result, status_code = patch_collateral_overview(location_id, data)
     if status_code == 200:
-        return jsonify(result.dict()), status_code
+        return model_response(result, status_code)
     return jsonify(result), status_code
 
 @collateral_bp.route('/fields', methods=['GET'])
@@ -29,8 +34,30 @@ def get_collateral_fields_endpoint():
 
 @collateral_bp.route('/openapi.yaml', methods=['GET'])
 def get_openapi_spec():
+    spec_yaml, _, yaml_etag, _ = render_openapi_spec()
+    return openapi_response(spec_yaml, 'text/yaml', yaml_etag)
+
+@collateral_bp.route('/openapi.json', methods=['GET'])
+def get_openapi_spec_json():
+    _, spec_json, _, json_etag = render_openapi_spec()
+    return openapi_response(spec_json, 'application/json', json_etag)
+
+def openapi_response(body, mimetype, etag):
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request) #304 when If-None-Match matches
+
+@lru_cache(maxsize=1)
+def render_openapi_spec():
+    # The models are fixed at import, so the spec is built and serialized only once per process.
     spec = generate_dynamic_openapi_spec()
-    return yaml.dump(spec, sort_keys=False, indent=2), 200, {'Content-Type': 'text/yaml'} #Added indent and sort keys
+    spec_yaml = yaml.dump(spec, sort_keys=False, indent=2).encode() #Added indent and sort keys
+    spec_json = json.dumps(spec).encode()
+    # Each representation gets its own strong ETag, since their bytes differ.
+    yaml_etag = hashlib.sha256(spec_yaml).hexdigest()[:32]
+    json_etag = hashlib.sha256(spec_json).hexdigest()[:32]
+    return spec_yaml, spec_json, yaml_etag, json_etag
 
 def generate_dynamic_openapi_spec():
     transaction_properties = {field_name: {"type": get_openapi_type(field_type)} for field_name, (field_type, _) in TransactionData.__fields__.items()}
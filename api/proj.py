@@ -20,7 +20,8 @@ mkdir src tests
 # Create app.py
 cat <<EOF > app.py
 import os
-from flask import Flask
+import time
+from flask import Flask, Response, g, request
 from dotenv import load_dotenv
 
 from src.presentation.oauth_blueprint import oauth_bp
@@ -30,10 +31,45 @@ from src.presentation.service_request_blueprint import service_request_bp
 from src.presentation.utilities_blueprint import utilities_bp
 from src.presentation.webhooks_blueprint import webhooks_bp
 from src.presentation.data_capture_blueprint import data_capture_bp
+from src.adapters.deadline import start_request_deadline
+from src.adapters.serialization import FastJSONProvider
+from src.adapters.metrics import CONTENT_TYPE, REGISTRY, REQUEST_LATENCY, REQUESTS_IN_FLIGHT
 
 load_dotenv()
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
+app.before_request(start_request_deadline)
+
+
+@app.before_request
+def start_request_metrics():
+    g.metrics_started = time.perf_counter()
+    g.metrics_status = 500
+    REQUESTS_IN_FLIGHT.inc()
+
+
+@app.after_request
+def capture_response_status(response):
+    g.metrics_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def record_request_metrics(exc):
+    if "metrics_started" not in g:
+        return
+    REQUESTS_IN_FLIGHT.dec()
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    REQUEST_LATENCY.labels(method=request.method, route=route, status=g.metrics_status).observe(
+        time.perf_counter() - g.metrics_started
+    )
+
+
+@app.route('/metrics')
+def metrics():
+    return Response(REGISTRY.render(), mimetype=CONTENT_TYPE)
+
 
 app.register_blueprint(oauth_bp)
 app.register_blueprint(collateral_bp)
@@ -72,12 +108,411 @@ pip freeze > requirements.txt
 # Create src directory structure
 mkdir src/adapters src/domain src/domain/collateral src/presentation
 
+# Create src/adapters/token_manager.py
+cat <<'EOF' > src/adapters/token_manager.py
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+# fetch_token(client_id, scope) -> (access_token, expires_in)
+TokenFetcher = Callable[[str, Optional[str]], Tuple[Optional[str], Optional[int]]]
+
+
+class CachedToken:
+    """A bearer token together with the monotonic times it should be refreshed and dropped."""
+
+    __slots__ = ("access_token", "refresh_at", "expires_at")
+
+    def __init__(self, access_token: str, refresh_at: float, expires_at: float):
+        self.access_token = access_token
+        self.refresh_at = refresh_at
+        self.expires_at = expires_at
+
+
+class TokenManager:
+    """
+    Caches bearer tokens per (client_id, scope).
+
+    Tokens are refreshed in a background thread once they enter the refresh
+    margin, and callers that find no usable token share a single in-flight fetch.
+    """
+
+    def __init__(self, fetch_token: TokenFetcher, refresh_margin: int = 60, default_expires_in: int = 300):
+        self._fetch_token = fetch_token
+        self._refresh_margin = refresh_margin
+        self._default_expires_in = default_expires_in
+        self._tokens: Dict[Tuple[str, Optional[str]], CachedToken] = {}
+        self._locks: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get_token(self, client_id: str, scope: Optional[str] = None) -> Optional[str]:
+        """Returns a valid token, fetching one only when none is cached or it has expired."""
+        key = (client_id, scope)
+        cached = self._tokens.get(key)
+        now = time.monotonic()
+        if cached and now < cached.expires_at:
+            if now >= cached.refresh_at:
+                self._refresh_in_background(key)
+            return cached.access_token
+
+        with self._lock_for(key):
+            # Another caller may have refreshed the token while we waited.
+            cached = self._tokens.get(key)
+            if cached and time.monotonic() < cached.expires_at:
+                return cached.access_token
+            return self._refresh(key)
+
+    def invalidate(self, client_id: str, scope: Optional[str] = None) -> None:
+        """Drops the cached token, e.g. after the upstream rejected it with a 401."""
+        self._tokens.pop((client_id, scope), None)
+
+    def _lock_for(self, key) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _refresh(self, key) -> Optional[str]:
+        access_token, expires_in = self._fetch_token(*key)
+        if not access_token:
+            return None
+        expires_in = int(expires_in or self._default_expires_in)
+        now = time.monotonic()
+        # Short-lived tokens are refreshed half way through instead of never.
+        refresh_in = max(expires_in - self._refresh_margin, expires_in / 2)
+        self._tokens[key] = CachedToken(access_token, now + refresh_in, now + expires_in)
+        return access_token
+
+    def _refresh_in_background(self, key) -> None:
+        lock = self._lock_for(key)
+        if not lock.acquire(blocking=False):
+            return  # A refresh for this key is already in flight.
+
+        def refresh():
+            try:
+                self._refresh(key)
+            except Exception as e:
+                print(f"Background token refresh failed: {e}")
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
+EOF
+
+# Create src/adapters/deadline.py
+cat <<'EOF' > src/adapters/deadline.py
+import json
+import os
+import time
+
+from flask import g, has_request_context, request
+
+# Total time an incoming request may spend on upstream work (token fetch, calls, retries).
+REQUEST_TIMEOUT_BUDGET = float(os.environ.get("REQUEST_TIMEOUT_BUDGET", "30"))
+# Per-route overrides as JSON, longest matching path prefix wins.
+ROUTE_TIMEOUT_BUDGETS = json.loads(os.environ.get("ROUTE_TIMEOUT_BUDGETS", "{}"))
+CONNECT_TIMEOUT = float(os.environ.get("UPSTREAM_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.environ.get("UPSTREAM_READ_TIMEOUT", "10"))
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def budget_for_path(path):
+    matches = [prefix for prefix in ROUTE_TIMEOUT_BUDGETS if path.startswith(prefix)]
+    if not matches:
+        return REQUEST_TIMEOUT_BUDGET
+    return float(ROUTE_TIMEOUT_BUDGETS[max(matches, key=len)])
+
+
+def start_request_deadline():
+    g.deadline = time.monotonic() + budget_for_path(request.path)
+
+
+def upstream_timeout():
+    """(connect, read) timeouts for the next upstream call, capped by the request's remaining budget."""
+    if not has_request_context() or "deadline" not in g:
+        return CONNECT_TIMEOUT, READ_TIMEOUT
+    remaining = g.deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded before calling upstream")
+    return min(CONNECT_TIMEOUT, remaining), min(READ_TIMEOUT, remaining)
+EOF
+
+# Create src/adapters/serialization.py
+cat <<'EOF' > src/adapters/serialization.py
+import json
+import os
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback.
+    orjson = None
+
+# "orjson" or "json". Defaults to orjson when it is installed.
+JSON_SERIALIZER = os.environ.get("JSON_SERIALIZER", "orjson" if orjson else "json")
+
+
+def _default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json") if hasattr(obj, "model_dump") else obj.dict()
+    return DefaultJSONProvider.default(obj)
+
+
+def dumps(obj):
+    if JSON_SERIALIZER == "orjson":
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def loads(data):
+    if JSON_SERIALIZER == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_model(model):
+    """Serializes a Pydantic model straight to JSON bytes, skipping the intermediate dict."""
+    if hasattr(model, "model_dump_json"):
+        return model.model_dump_json().encode()
+    return dumps(model.dict())
+
+
+def model_response(model, status_code=200):
+    return Response(dump_model(model), status=status_code, mimetype="application/json")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Makes jsonify() and request.get_json() use the configured serializer."""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+EOF
+
+# Create src/adapters/metrics.py
+cat <<'EOF' > src/adapters/metrics.py
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class _Metric:
+    """A named metric with optional labels; values are kept per label combination."""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def labels(self, **labels):
+        return _Child(self, tuple(str(labels[name]) for name in self.labelnames))
+
+    def _key(self, key):
+        if key is None:
+            if self.labelnames:
+                raise ValueError(f"{self.name} requires labels {self.labelnames}")
+            return ()
+        return key
+
+    def _label_text(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key, value):
+        return [f"{self.name}{self._label_text(key)} {_format(value)}"]
+
+
+class _Child:
+    """A metric bound to one set of label values."""
+
+    __slots__ = ("_metric", "_key")
+
+    def __init__(self, metric, key):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount=1):
+        self._metric.inc(amount, _key=self._key)
+
+    def dec(self, amount=1):
+        self._metric.dec(amount, _key=self._key)
+
+    def set(self, value):
+        self._metric.set(value, _key=self._key)
+
+    def observe(self, value):
+        self._metric.observe(value, _key=self._key)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, amount=1, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, _key=None):
+        self.inc(-amount, _key=_key)
+
+    def set(self, value, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self, key, value):
+        counts, total, count = value
+        lines = [
+            f"{self.name}_bucket{self._label_text(key, [('le', _format(bound))])} {count_}"
+            for bound, count_ in zip(self.buckets, counts)
+        ]
+        lines.append(f"{self.name}_bucket{self._label_text(key, [('le', '+Inf')])} {count}")
+        lines.append(f"{self.name}_sum{self._label_text(key)} {_format(total)}")
+        lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+
+    def render(self):
+        """The registry in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+REGISTRY = MetricsRegistry()
+
+# Incoming requests
+REQUEST_LATENCY = Histogram(
+    "facade_request_duration_seconds", "Time spent serving incoming requests.", ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge("facade_requests_in_flight", "Incoming requests currently being served.")
+
+# Upstream calls
+UPSTREAM_LATENCY = Histogram(
+    "upstream_request_duration_seconds", "Latency of upstream LOS calls.", ["endpoint", "method"]
+)
+UPSTREAM_REQUESTS = Counter(
+    "upstream_requests_total", "Upstream LOS calls by response status.", ["endpoint", "method", "status"]
+)
+UPSTREAM_IN_FLIGHT = Gauge("upstream_requests_in_flight", "Upstream LOS calls currently in flight.", ["endpoint"])
+UPSTREAM_RATE_LIMITED = Counter("upstream_rate_limited_total", "Upstream 429 responses.", ["endpoint"])
+TOKEN_REFRESHES = Counter("token_refreshes_total", "Access token fetches from the authentication server.", ["result"])
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache lookups by result.", ["cache", "result"])
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_label(path):
+    """Upstream path with numeric IDs collapsed so each endpoint is one label value."""
+    return _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0])
+
+
+@contextmanager
+def track_upstream(endpoint, method):
+    """
+    Records latency, in-flight count and outcome of one upstream call.
+    Set `call["status"]` to the response status inside the block; it stays "error" otherwise.
+    """
+    UPSTREAM_IN_FLIGHT.labels(endpoint=endpoint).inc()
+    call = {"status": "error"}
+    started = time.perf_counter()
+    try:
+        yield call
+    finally:
+        UPSTREAM_IN_FLIGHT.labels(endpoint=endpoint).dec()
+        UPSTREAM_LATENCY.labels(endpoint=endpoint, method=method).observe(time.perf_counter() - started)
+        UPSTREAM_REQUESTS.labels(endpoint=endpoint, method=method, status=call["status"]).inc()
+        if call["status"] == 429:
+            UPSTREAM_RATE_LIMITED.labels(endpoint=endpoint).inc()
+EOF
+
 # Create src/adapters/api_client.py
 cat <<EOF > src/adapters/api_client.py
 import requests
 import os
 import json
+from urllib.parse import urlparse
 from dotenv import load_dotenv
+from src.adapters.token_manager import TokenManager
+from src.adapters.deadline import DeadlineExceeded, upstream_timeout
+from src.adapters.serialization import loads
+from src.adapters.metrics import TOKEN_REFRESHES, endpoint_label, track_upstream
 
 load_dotenv()
 
@@ -90,28 +525,40 @@ PROXIES = {
     "http": os.environ.get("PROXY_HTTP"),
     "https": os.environ.get("PROXY_HTTPS"),
 }
+TOKEN_REFRESH_MARGIN = int(os.environ.get("TOKEN_REFRESH_MARGIN", "60"))
+TOKEN_ENDPOINT = endpoint_label(urlparse(TOKEN_URL or "").path)
 
-def get_bearer_token():
+def request_bearer_token(client_id, scope=None):
     try:
         data = {
             "grant_type": "client_credentials",
-            "client_id": CLIENT_ID,
+            "client_id": client_id,
             "client_secret": CLIENT_SECRET,
-            "scope": SCOPE,
+            "scope": scope,
         }
-        response = requests.post(TOKEN_URL, data=data, proxies=PROXIES)
+        timeout = upstream_timeout()
+        with track_upstream(TOKEN_ENDPOINT, "POST") as call:
+            response = requests.post(TOKEN_URL, data=data, proxies=PROXIES, timeout=timeout)
+            call["status"] = response.status_code
         response.raise_for_status()
-        token_data = response.json()
-        return token_data.get("access_token")
-    except requests.exceptions.RequestException as e:
+        token_data = loads(response.content)
+        TOKEN_REFRESHES.labels(result="success").inc()
+        return token_data.get("access_token"), token_data.get("expires_in")
+    except (requests.exceptions.RequestException, DeadlineExceeded) as e:
+        TOKEN_REFRESHES.labels(result="failure").inc()
         print(f"Error getting token: {e}")
-        return None
+        return None, None
     except json.JSONDecodeError as e:
         print(f"Error decoding JSON: {e}")
-        return None
+        return None, None
     except KeyError as e:
         print(f"KeyError: {e}. Check token response format.")
-        return None
+        return None, None
+
+token_manager = TokenManager(request_bearer_token, refresh_margin=TOKEN_REFRESH_MARGIN)
+
+def get_bearer_token():
+    return token_manager.get_token(CLIENT_ID, SCOPE)
 
 def make_api_request(endpoint, params=None, method='GET', data=None):
     token = get_bearer_token()
@@ -122,22 +569,29 @@ def make_api_request(endpoint, params=None, method='GET', data=None):
     full_target_url = f"{TARGET_API_URL}{endpoint}"
 
     try:
-        if method == 'GET':
-            response = requests.get(full_target_url, headers=headers, params=params, proxies=PROXIES)
-        elif method == 'POST':
-            response = requests.post(full_target_url, headers=headers, json=data, proxies=PROXIES)
-        elif method == 'PUT':
-            response = requests.put(full_target_url, headers=headers, json=data, proxies=PROXIES)
-        elif method == 'PATCH':
-            response = requests.patch(full_target_url, headers=headers, json=data, proxies=PROXIES)
-        elif method == 'DELETE':
-            response = requests.delete(full_target_url, headers=headers, proxies=PROXIES)
-        else:
+        timeout = upstream_timeout()
+        if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
             return None, 400
-
+        with track_upstream(endpoint_label(endpoint), method) as call:
+            if method == 'GET':
+                response = requests.get(full_target_url, headers=headers, params=params, proxies=PROXIES, timeout=timeout)
+            elif method == 'POST':
+                response = requests.post(full_target_url, headers=headers, json=data, proxies=PROXIES, timeout=timeout)
+            elif method == 'PUT':
+                response = requests.put(full_target_url, headers=headers, json=data, proxies=PROXIES, timeout=timeout)
+            elif method == 'PATCH':
+                response = requests.patch(full_target_url, headers=headers, json=data, proxies=PROXIES, timeout=timeout)
+            elif method == 'DELETE':
+                response = requests.delete(full_target_url, headers=headers, proxies=PROXIES, timeout=timeout)
+            call["status"] = response.status_code
+
+        if response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
         response.raise_for_status()
-        return response.json(), 200
+        return loads(response.content), 200
 
+    except (requests.exceptions.Timeout, DeadlineExceeded) as e:
+        return None, 504
     except requests.exceptions.RequestException as e:
         return None, 500
     except json.JSONDecodeError as e:
@@ -0,0 +1 @@
+"""Load benchmarks for the facade variants against a fake LOS upstream."""
@@ -0,0 +1,127 @@
+"""
+Benchmarks the facade variants against the fake LOS upstream.
+
+    python -m benchmarks --variants geminiV2 los --requests 2000 --concurrency 32 \
+        --latency-ms 20 --collaterals 200 --output results.json
+
+Each variant runs in its own subprocess against a fresh FakeLOS; the combined
+results (throughput, p50/p95/p99 per scenario, upstream request counts) are
+written as JSON for regression tracking.
+"""
+import argparse
+import ast
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.fake_los import FakeLOS, FakeLOSConfig
+from benchmarks.scenarios import REPO_ROOT, VARIANTS
+
+
+def parse_setting(setting):
+    key, _, value = setting.partition("=")
+    try:
+        return key, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return key, value
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_variant(variant, upstream_config, options, timeout):
+    with FakeLOS(upstream_config) as upstream, tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "result.json"
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.scenarios", variant, upstream.url, json.dumps(options), str(output_path)],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=timeout,
+        )
+        if completed.returncode != 0 or not output_path.exists():
+            return {"error": completed.stderr.strip().splitlines()[-20:]}
+        return {"scenarios": json.loads(output_path.read_text()), "upstream": upstream.stats()}
+
+
+def print_summary(results):
+    print(f"{'variant':<10} {'scenario':<36} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9}  status", file=sys.stderr)
+    for variant, result in results.items():
+        if "error" in result:
+            print(f"{variant:<10} failed: {result['error'][-1] if result['error'] else 'no output'}", file=sys.stderr)
+            continue
+        for name, stats in result["scenarios"].items():
+            if name == "skipped":
+                print(f"{variant:<10} skipped: {stats}", file=sys.stderr)
+                continue
+            print(
+                f"{variant:<10} {name:<36} {stats['throughput_rps']:>9} {stats['p50_ms']:>9} "
+                f"{stats['p95_ms']:>9} {stats['p99_ms']:>9}  {stats['status_codes']}",
+                file=sys.stderr,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="sequential requests before measuring")
+    parser.add_argument("--locations", type=int, default=1000, help="distinct location IDs cycled through")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="upstream latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="uniform extra upstream latency")
+    parser.add_argument("--collaterals", type=int, default=10, help="collaterals per overview (payload size)")
+    parser.add_argument("--service-request-collaterals", type=int, default=2)
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="answer every Nth upstream call with 429")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After of injected 429s")
+    parser.add_argument("--los-config", action="append", default=[], metavar="KEY=VALUE",
+                        help="override a los/src/config.py setting, e.g. RATE_LIMIT_INITIAL_RATE=1000")
+    parser.add_argument("--flask-project", help="project generated by api/proj.py, required for the flask variant")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per variant")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    upstream_config = FakeLOSConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        collaterals=args.collaterals,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after,
+    )
+    options = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "warmup": args.warmup,
+        "locations": args.locations,
+        "collaterals": args.collaterals,
+        "service_request_collaterals": args.service_request_collaterals,
+        "los_config": dict(parse_setting(setting) for setting in args.los_config),
+        "flask_project": args.flask_project,
+    }
+
+    results = {variant: run_variant(variant, upstream_config, options, args.timeout) for variant in args.variants}
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "upstream": asdict(upstream_config),
+        "options": options,
+        "results": results,
+    }
+    print_summary(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+In-process stand-in for the LOS upstream, so the facades can be benchmarked
+without credentials or network access.
+
+Serves the endpoints the facades call (oauth token, collateral overview and
+fields, service request fields and form, service types) from a stdlib
+ThreadingHTTPServer with configurable latency, payload size and 429 injection.
+"""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SERVICE_TYPES = [
+    {"serviceType": "Appraisal", "displayName": "Appraisal", "featureIDs": [101, 102]},
+    {"serviceType": "Environmental", "displayName": "Environmental Report", "featureIDs": [201]},
+    {"serviceType": "PropertyCondition", "displayName": "Property Condition Assessment", "featureIDs": [301, 302]},
+]
+
+COLLATERAL_OVERVIEW_PATH = re.compile(r"/collateralOverview/(\d+)$")
+
+
+@dataclass
+class FakeLOSConfig:
+    latency_ms: float = 0.0  # added to every response except oauth
+    jitter_ms: float = 0.0  # uniform extra latency on top of latency_ms
+    collaterals: int = 10  # collaterals per overview, drives payload size
+    rate_limit_every: int = 0  # every Nth non-oauth request gets a 429; 0 disables
+    retry_after: float = 0.0  # Retry-After sent with injected 429s
+    token_expires_in: int = 3600
+
+
+def _field_schema(properties):
+    return {"type": "object", "properties": properties}
+
+
+def collateral_fields_payload():
+    transaction = {
+        "loanNumber": {"type": "string"},
+        "borrowerName": {"type": "string"},
+        "loanAmount": {"type": "integer"},
+        "closingDate": {"type": "string"},
+        "isRefinance": {"type": "boolean"},
+    }
+    collateral = {
+        "collateralID": {"type": "integer"},
+        "address": {"type": "string"},
+        "city": {"type": "string"},
+        "state": {"type": "string"},
+        "propertyType": {"type": "string", "enum": ["Office", "Retail", "Industrial", "Multifamily"]},
+        "estimatedValue": {"type": "integer"},
+    }
+    schema = _field_schema({
+        "meta": _field_schema({"updatedBy": {"type": "string"}}),
+        "data": _field_schema({
+            "transaction": _field_schema(transaction),
+            "collaterals": {"type": "array", "items": _field_schema(collateral)},
+        }),
+    })
+    return {"data": {"model": {"jsonSchema": schema}}}
+
+
+def service_request_fields_payload():
+    service = _field_schema({
+        "serviceType": {"type": "string"},
+        "featureID": {"type": "integer"},
+    })
+    collateral = _field_schema({
+        "address": {"type": "string"},
+        "propertyType": {"type": "string", "enum": ["Office", "Retail", "Industrial", "Multifamily"]},
+        "services": {"type": "array", "items": service},
+    })
+    schema = _field_schema({
+        "meta": _field_schema({
+            "requestedBy": {"type": "string"},
+            "currency": {"type": "string"},
+            "processAsWarnings": {"type": "boolean"},
+        }),
+        "data": _field_schema({
+            "transaction": _field_schema({"loanNumber": {"type": "string"}}),
+            "collaterals": {"type": "array", "items": collateral},
+        }),
+    })
+    schema["required"] = ["meta", "data"]
+    return {"data": {"model": {"jsonSchema": schema}}}
+
+
+def collateral_overview_payload(location_id, collaterals):
+    rng = random.Random(location_id)
+    return {
+        "meta": {"updatedBy": "bench@example.com"},
+        "data": {
+            "transaction": {
+                "loanNumber": f"LN-{location_id}",
+                "borrowerName": "Benchmark Holdings LLC",
+                "loanAmount": 1000000 + location_id,
+                "closingDate": "2024-01-27",
+                "isRefinance": False,
+            },
+            "collaterals": [
+                {
+                    "collateralID": location_id * 1000 + i,
+                    "address": f"{i} Benchmark Way",
+                    "city": "Springfield",
+                    "state": "IL",
+                    "propertyType": rng.choice(["Office", "Retail", "Industrial", "Multifamily"]),
+                    "estimatedValue": rng.randint(100000, 10000000),
+                }
+                for i in range(collaterals)
+            ],
+        },
+    }
+
+
+def service_request_body(collaterals=2):
+    """A request body that passes the fake service request schema and service type checks."""
+    return {
+        "meta": {"requestedBy": "bench@example.com", "currency": "USD", "processAsWarnings": True},
+        "data": {
+            "transaction": {"loanNumber": "LN-1"},
+            "collaterals": [
+                {
+                    "address": f"{i} Benchmark Way",
+                    "propertyType": "Office",
+                    "services": [{"serviceType": "Appraisal", "featureID": 101}],
+                }
+                for i in range(collaterals)
+            ],
+        },
+    }
+
+
+class FakeLOS:
+    """
+    Runs the fake upstream on a background thread.
+
+        with FakeLOS(FakeLOSConfig(latency_ms=20)) as los:
+            ... point TARGET_API_URL at los.url ...
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or FakeLOSConfig()
+        self.requests = Counter()
+        self.rate_limited = 0
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._fields = self._encode(collateral_fields_payload())
+        self._fields_etag = '"%s"' % hashlib.sha256(self._fields).hexdigest()[:16]
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self):
+        with self._lock:
+            return {"requests": dict(self.requests), "rate_limited": self.rate_limited}
+
+    @staticmethod
+    def _encode(payload):
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def _record(self, path):
+        """Counts the request and returns whether it should be answered with an injected 429."""
+        every = self.config.rate_limit_every
+        with self._lock:
+            self.requests[COLLATERAL_OVERVIEW_PATH.sub("/collateralOverview/{id}", path)] += 1
+            if path.endswith("/oauth/token") or every <= 0:
+                return False
+            self._counter += 1
+            if self._counter % every == 0:
+                self.rate_limited += 1
+                return True
+        return False
+
+    def _delay(self):
+        delay = self.config.latency_ms + random.uniform(0, self.config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _handler_class(self):
+        los = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real upstream
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+            def _send(self, status, body=b"", headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def _dispatch(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                path = self.path.split("?", 1)[0]
+                rate_limited = los._record(path)
+
+                if method == "POST" and path.endswith("/oauth/token"):
+                    token = {"access_token": f"fake-{time.monotonic_ns()}", "token_type": "Bearer",
+                             "expires_in": los.config.token_expires_in}
+                    # Both shapes the facades read: top-level (los) and under "data" (gemini variants).
+                    return self._send(200, los._encode({**token, "data": token}))
+
+                if rate_limited:
+                    return self._send(429, los._encode({"message": "Too Many Requests"}),
+                                      {"Retry-After": f"{los.config.retry_after:g}"})
+                los._delay()
+
+                if method == "GET" and path.endswith("/collateralOverview/fields"):
+                    if self.headers.get("If-None-Match") == los._fields_etag:
+                        return self._send(304, headers={"ETag": los._fields_etag})
+                    return self._send(200, los._fields, {"ETag": los._fields_etag})
+                match = COLLATERAL_OVERVIEW_PATH.search(path)
+                if match and method == "GET":
+                    payload = collateral_overview_payload(int(match.group(1)), los.config.collaterals)
+                    return self._send(200, los._encode(payload))
+                if match and method == "PATCH":
+                    payload = {"meta": {"success": True}, "data": {"locationID": int(match.group(1))}}
+                    return self._send(200, los._encode(payload))
+                if method == "GET" and path.endswith("/serviceRequest/fields"):
+                    return self._send(200, los._encode(service_request_fields_payload()))
+                if method == "GET" and path.endswith("/utility/serviceTypes"):
+                    return self._send(200, los._encode({"data": SERVICE_TYPES}))
+                if method == "POST" and path.endswith("/serviceRequest/form"):
+                    payload = {"meta": {"success": True, "responseCode": 201},
+                               "data": {"serviceRequestID": random.randint(100000, 200000), "locationID": [1]}}
+                    return self._send(201, los._encode(payload))
+                return self._send(404, los._encode({"message": f"No fake for {method} {path}"}))
+
+        return Handler
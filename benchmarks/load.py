@@ -0,0 +1,90 @@
+"""Closed-loop load generation and latency summaries."""
+import asyncio
+import math
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(p / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, statuses, elapsed):
+    """Throughput and latency percentiles (milliseconds) for one scenario run."""
+    ordered = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 3) if seconds is not None else None
+    return {
+        "requests": len(ordered),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else None,
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "max_ms": ms(ordered[-1] if ordered else None),
+        "mean_ms": ms(sum(ordered) / len(ordered) if ordered else None),
+        "status_codes": {str(code): count for code, count in sorted(Counter(statuses).items(), key=str)},
+    }
+
+
+async def run_http_load(base_url, make_request, total, concurrency, warmup=0):
+    """
+    Sends `total` requests from `concurrency` workers, each starting the next request
+    as soon as its previous one finishes. `make_request(i)` returns (method, path, json_body).
+    Transport errors are recorded with status "error".
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+
+        async def send(i):
+            method, path, body = make_request(i)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                await response.aread()
+                status = response.status_code
+            except httpx.HTTPError:
+                status = "error"
+            return time.perf_counter() - started, status
+
+        for i in range(warmup):
+            await send(-1 - i)
+
+        latencies, statuses = [], []
+        counter = iter(range(total))
+
+        async def worker():
+            for i in counter:
+                latency, status = await send(i)
+                latencies.append(latency)
+                statuses.append(status)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return summarize(latencies, statuses, time.perf_counter() - started)
+
+
+def run_call_load(call, total, concurrency, warmup=0):
+    """Thread-pool counterpart of run_http_load for blocking callables; `call(i)` returns a status."""
+    for i in range(warmup):
+        call(-1 - i)
+
+    def timed(i):
+        started = time.perf_counter()
+        try:
+            status = call(i)
+        except Exception:
+            status = "error"
+        return time.perf_counter() - started, status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, range(total)))
+    elapsed = time.perf_counter() - started
+    return summarize([latency for latency, _ in results], [status for _, status in results], elapsed)
@@ -0,0 +1,182 @@
+"""
+Per-variant benchmark scenarios.
+
+Every variant imports its code as a top-level `src` package, so each one runs in
+its own interpreter:
+
+    python -m benchmarks.scenarios VARIANT UPSTREAM_URL OPTIONS_JSON OUTPUT_PATH
+
+The facade is served on an ephemeral port from a background thread and driven
+from the same process; results are written to OUTPUT_PATH as JSON.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.fake_los import collateral_overview_payload, service_request_body
+from benchmarks.load import run_call_load, run_http_load
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def serve_asgi(app):
+    """Starts `app` under uvicorn on a background thread. Returns (base_url, stop)."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 30
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("ASGI server failed to start")
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    def stop():
+        server.should_exit = True
+        thread.join(timeout=30)
+
+    return f"http://127.0.0.1:{port}", stop
+
+
+def serve_wsgi(app):
+    """Starts a Flask app on a threaded werkzeug server. Returns (base_url, stop)."""
+    from werkzeug.serving import make_server
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return f"http://127.0.0.1:{server.port}", server.shutdown
+
+
+def run_http_scenarios(base_url, scenarios, options):
+    """Runs each named (method, path, body) factory against `base_url`."""
+    return {
+        name: asyncio.run(run_http_load(
+            base_url, make_request, options["requests"], options["concurrency"], warmup=options["warmup"],
+        ))
+        for name, make_request in scenarios.items()
+    }
+
+
+def location_id(i, options):
+    return 1 + i % options["locations"]
+
+
+def gemini(options):
+    # The gemini variant has no presentation layer in the tree, so its adapter is driven directly.
+    sys.path.insert(0, str(REPO_ROOT / "gemini"))
+    from src.adapters.api_client import make_api_request
+
+    def call(i):
+        _, status_code = make_api_request(f"/collateralOverview/{location_id(i, options)}")
+        return status_code
+
+    return {
+        "GET collateralOverview (adapter)": run_call_load(
+            call, options["requests"], options["concurrency"], warmup=options["warmup"],
+        ),
+    }
+
+
+def gemini_v2(options):
+    # The package directory is `stc` but the code imports itself as `src`.
+    sys.path.insert(0, str(REPO_ROOT / "geminiV2"))
+    import stc
+
+    sys.modules["src"] = stc
+    from app import app
+
+    base_url, stop = serve_asgi(app)
+    try:
+        return run_http_scenarios(base_url, {
+            "GET collateralOverview": lambda i: (
+                "GET", f"/collateral/collateralOverview/{location_id(i, options)}", None),
+            "GET collateralOverview passthrough": lambda i: (
+                "GET", f"/collateral/collateralOverview/{location_id(i, options)}?passthrough=true", None),
+            "PATCH collateralOverview": lambda i: (
+                "PATCH", f"/collateral/collateralOverview/{location_id(i, options)}",
+                collateral_overview_payload(location_id(i, options), options["collaterals"])),
+        }, options)
+    finally:
+        stop()
+
+
+def los(options):
+    sys.path.insert(0, str(REPO_ROOT / "los"))
+    from src import config
+
+    # Modules copy config values at import, so overrides must land before anything else is imported.
+    config.API_BASE_URL = os.environ["TARGET_API_URL"]
+    config.TOKEN_URL = os.environ["TOKEN_URL"]
+    config.PROXY = None
+    config.SERVICE_REQUEST_JOB_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="bench-"), "jobs.sqlite3")
+    for key, value in options["los_config"].items():
+        if not hasattr(config, key):
+            raise KeyError(f"Unknown los config setting {key}")
+        setattr(config, key, value)
+    from src.main import app
+
+    body = service_request_body(options["service_request_collaterals"])
+    base_url, stop = serve_asgi(app)
+    try:
+        return run_http_scenarios(base_url, {
+            "POST service-request": lambda i: ("POST", "/wrapper/service-request", body),
+            "GET service-types": lambda i: ("GET", "/wrapper/service-types", None),
+        }, options)
+    finally:
+        stop()
+
+
+def flask(options):
+    # api/code.py is a blueprint for the project generated by api/proj.py; it needs that project to run.
+    project = options.get("flask_project")
+    if not project:
+        return {"skipped": "pass --flask-project with a project generated by api/proj.py"}
+    sys.path.insert(0, str(Path(project).resolve()))
+    from app import app
+
+    base_url, stop = serve_wsgi(app)
+    try:
+        return run_http_scenarios(base_url, {
+            "GET collateralOverview": lambda i: (
+                "GET", f"/collateral/collateralOverview/{location_id(i, options)}", None),
+        }, options)
+    finally:
+        stop()
+
+
+VARIANTS = {
+    "gemini": gemini,
+    "geminiV2": gemini_v2,
+    "los": los,
+    "flask": flask,
+}
+
+
+def main(argv):
+    variant, upstream_url, options, output_path = argv[1], argv[2], json.loads(argv[3]), argv[4]
+    os.environ.update({
+        "TARGET_API_URL": upstream_url,
+        "TOKEN_URL": f"{upstream_url}/oauth/token",
+        "CLIENT_ID": "benchmark",
+        "CLIENT_SECRET": "benchmark",
+        "COLLATERAL_FIELDS_CACHE_PATH": os.path.join(tempfile.mkdtemp(prefix="bench-"), "collateral_fields.json"),
+    })
+    for name in ("PROXY_HTTP", "PROXY_HTTPS", "HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY"):
+        os.environ.pop(name, None)
+        os.environ.pop(name.lower(), None)
+
+    results = VARIANTS[variant](options)
+    with open(output_path, "w") as f:
+        json.dump(results, f)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
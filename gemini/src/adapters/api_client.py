@@ -3,6 +3,7 @@ import requests
 import os
 import json
 from dotenv import load_dotenv
+from src.adapters.token_manager import TokenManager
 
 load_dotenv()
 
@@ -15,28 +16,36 @@ PROXIES = {
     "http": os.getenv("PROXY_HTTP"),
     "https": os.getenv("PROXY_HTTPS"),
 }
+TOKEN_REFRESH_MARGIN = int(os.getenv("TOKEN_REFRESH_MARGIN", "60"))
+# (connect, read) seconds; requests waits forever without them.
+TIMEOUT = (float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "3.05")), float(os.getenv("UPSTREAM_READ_TIMEOUT", "10")))
 
-def get_bearer_token():
+def request_bearer_token(client_id, scope=None):
     try:
         data = {
             "grant_type": "client_credentials",
-            "client_id": CLIENT_ID,
+            "client_id": client_id,
             "client_secret": CLIENT_SECRET,
-            "scope": SCOPE,
+            "scope": scope,
         }
-        response = requests.post(TOKEN_URL, data=data, proxies=PROXIES)
+        response = requests.post(TOKEN_URL, data=data, proxies=PROXIES, timeout=TIMEOUT)
         response.raise_for_status()
-        token_data = response.json()
-        return token_data.get("data").get("access_token")
+        token_data = response.json().get("data")
+        return token_data.get("access_token"), token_data.get("expires_in")
     except requests.exceptions.RequestException as e:
         print(f"Error getting token: {e}")
-        return None
+        return None, None
     except json.JSONDecodeError as e:
         print(f"Error decoding JSON: {e}")
-        return None
+        return None, None
     except KeyError as e:
         print(f"KeyError: {e}. Check token response format.")
-        return None
+        return None, None
+
+token_manager = TokenManager(request_bearer_token, refresh_margin=TOKEN_REFRESH_MARGIN)
+
+def get_bearer_token():
+    return token_manager.get_token(CLIENT_ID, SCOPE)
 
 def make_api_request(endpoint, params=None, method='GET', data=None):
     token = get_bearer_token()
@@ -48,17 +57,21 @@ def make_api_request(endpoint, params=None, method='GET', data=None):
 
     try:
         if method == 'GET':
-            response = requests.get(url, headers=headers, params=params, proxies=PROXIES)
+            response = requests.get(url, headers=headers, params=params, proxies=PROXIES, timeout=TIMEOUT)
         elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data, params=params, proxies=PROXIES)
+            response = requests.post(url, headers=headers, json=data, params=params, proxies=PROXIES, timeout=TIMEOUT)
         elif method == 'PATCH':
-            response = requests.patch(url, headers=headers, json=data, params=params, proxies=PROXIES)
+            response = requests.patch(url, headers=headers, json=data, params=params, proxies=PROXIES, timeout=TIMEOUT)
         else:
             return {"error": "Invalid method"}, 400
 
+        if response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
         response.raise_for_status()
         response_json = response.json()
         return response_json, response.status_code
+    except requests.exceptions.Timeout as e:
+        return {"error": f"Timed out waiting for API: {e}"}, 504
     except requests.exceptions.RequestException as e:
         return {"error": str(e)}, response.status_code if 'response' in locals() else 500
     except json.JSONDecodeError as e:
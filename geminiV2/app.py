@@ -1,12 +1,75 @@
 # my-facade-api/app.py
 import os
-from fastapi import FastAPI
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from dotenv import load_dotenv
 from src.presentation.collateral_router import router as collateral_router
+from src.domain.collateral.registry import model_registry
+from src.domain.collateral.write_behind import collateral_overview_writes
+from src.adapters.async_api_client import open_async_client, close_async_client
+from src.adapters.deadline import budget_for_path, request_deadline
+from src.adapters.serialization import FastJSONResponse
+from src.adapters.metrics import CONTENT_TYPE, REGISTRY, REQUEST_LATENCY, REQUESTS_IN_FLIGHT, endpoint_label
+from src.adapters.tracing import tracer, server_timing
 
 load_dotenv()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_async_client()
+    revalidation = asyncio.create_task(model_registry.watch())
+    yield
+    revalidation.cancel()
+    # Pending coalesced edits are written before the upstream client goes away.
+    await collateral_overview_writes.drain()
+    await close_async_client()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+
+
+@app.middleware("http")
+async def apply_request_deadline(request: Request, call_next):
+    # Token fetches, upstream calls and retries made for this request all draw from one budget.
+    with request_deadline(budget_for_path(request.url.path)):
+        return await call_next(request)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    REQUESTS_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        # Numeric IDs are collapsed and unrouted paths grouped so label values stay bounded.
+        route = endpoint_label(request.url.path) if "route" in request.scope else "unmatched"
+        REQUEST_LATENCY.labels(method=request.method, route=route, status=status).observe(time.perf_counter() - started)
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    # Root span for the request; adapter spans nest under it and join the caller's trace via traceparent.
+    with tracer.start_span(request.method, kind="server", traceparent=request.headers.get("traceparent")) as span:
+        response = await call_next(request)
+        if span is not None:
+            span.name = f"{request.method} {endpoint_label(request.url.path)}"
+            span.set_attribute("http.status_code", response.status_code)
+            response.headers["Server-Timing"] = server_timing(span)
+        return response
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 
 app.include_router(collateral_router, prefix="/collateral")
 
@@ -2,8 +2,16 @@
 import requests
 import os
 import json
+import time
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 from fastapi import HTTPException
+from src.adapters.token_manager import TokenManager
+from src.adapters.circuit_breaker import CircuitBreaker, circuit_breakers
+from src.adapters.deadline import upstream_timeout
+from src.adapters.serialization import loads
+from src.adapters.metrics import TOKEN_REFRESHES, endpoint_label, track_upstream
+from src.adapters.tracing import inject_trace_context, set_span_attribute, traced
 
 load_dotenv()
 
@@ -16,22 +24,51 @@ PROXIES = {
     "http": os.getenv("PROXY_HTTP"),
     "https": os.getenv("PROXY_HTTPS"),
 }
+TOKEN_REFRESH_MARGIN = int(os.getenv("TOKEN_REFRESH_MARGIN", "60"))
+TOKEN_ENDPOINT = endpoint_label(urlparse(TOKEN_URL or "").path)
 
 
-def get_bearer_token():
-    """Retrieves a bearer token from the authentication server."""
+def check_circuit(breaker: CircuitBreaker):
+    """Fails fast with a 503 while the endpoint group's circuit is open."""
+    if not breaker.allow_request():
+        raise HTTPException(
+            status_code=503,
+            detail=f"Upstream '{breaker.name}' is temporarily unavailable",
+            headers={"Retry-After": str(breaker.retry_after())},
+        )
+
+
+def request_bearer_token(client_id: str, scope: str = None):
+    """Retrieves a new bearer token and its lifetime from the authentication server."""
+    breaker = circuit_breakers.get("oauth")
+    check_circuit(breaker)
+    started = time.monotonic()
+    result = "failure"
     try:
         data = {
             "grant_type": "client_credentials",
-            "client_id": CLIENT_ID,
+            "client_id": client_id,
             "client_secret": CLIENT_SECRET,
-            "scope": SCOPE,
+            "scope": scope,
         }
-        response = requests.post(TOKEN_URL, data=data, proxies=PROXIES)
+        with track_upstream(TOKEN_ENDPOINT, "POST") as call:
+            response = requests.post(
+                TOKEN_URL, data=data, headers=inject_trace_context({}), proxies=PROXIES, timeout=upstream_timeout()
+            )
+            call["status"] = response.status_code
+        set_span_attribute("http.status_code", response.status_code)
+        breaker.record(response.status_code < 500, time.monotonic() - started)
         response.raise_for_status()
-        token_data = response.json()
-        return token_data.get("data").get("access_token")
+        token_data = response.json().get("data")
+        result = "success"
+        return token_data.get("access_token"), token_data.get("expires_in")
+    except requests.exceptions.Timeout as e:
+        breaker.record(False, time.monotonic() - started)
+        print(f"Timed out getting token: {e}")
+        raise HTTPException(status_code=504, detail="Timed out retrieving bearer token")
     except requests.exceptions.RequestException as e:
+        if not isinstance(e, requests.exceptions.HTTPError):
+            breaker.record(False, time.monotonic() - started)
         print(f"Error getting token: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve bearer token")
     except json.JSONDecodeError as e:
@@ -40,33 +77,99 @@ def get_bearer_token():
     except KeyError as e:
         print(f"KeyError: {e}. Check token response format.")
         raise HTTPException(status_code=500, detail="Invalid token response format")
+    finally:
+        TOKEN_REFRESHES.labels(result=result).inc()
 
 
+token_manager = TokenManager(request_bearer_token, refresh_margin=TOKEN_REFRESH_MARGIN)
+
+
+@traced("get_bearer_token")
+def get_bearer_token():
+    """Returns a cached bearer token, only going to the authentication server when needed."""
+    return token_manager.get_token(CLIENT_ID, SCOPE)
+
+
+@traced("make_api_request", kind="client")
 def make_api_request(endpoint: str, method: str = "GET", params: dict = None, data: dict = None):
     """Makes a request to the target API with the given endpoint and parameters."""
+    if method not in ("GET", "POST", "PATCH"):
+        raise HTTPException(status_code=405, detail=f"Method '{method}' not allowed")
+
     token = get_bearer_token()
-    headers = {"Authorization": f"Bearer {token}"}
+    breaker = circuit_breakers.for_endpoint(endpoint)
+    check_circuit(breaker)
+    headers = inject_trace_context({"Authorization": f"Bearer {token}"})
     url = f"{TARGET_API_URL}{endpoint}"
 
+    timeout = upstream_timeout()
+    started = time.monotonic()
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params, proxies=PROXIES)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, params=params, proxies=PROXIES)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data, params=params, proxies=PROXIES)
-        else:
-            raise HTTPException(status_code=405, detail=f"Method '{method}' not allowed")
+        with track_upstream(endpoint_label(endpoint), method) as call:
+            if method == "GET":
+                response = requests.get(url, headers=headers, params=params, proxies=PROXIES, timeout=timeout)
+            elif method == "POST":
+                response = requests.post(url, headers=headers, json=data, params=params, proxies=PROXIES, timeout=timeout)
+            elif method == "PATCH":
+                response = requests.patch(url, headers=headers, json=data, params=params, proxies=PROXIES, timeout=timeout)
+            call["status"] = response.status_code
+        set_span_attribute("http.status_code", response.status_code)
 
+        breaker.record(response.status_code < 500, time.monotonic() - started)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
     except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
         try:
             error_message = e.response.json()
         except json.JSONDecodeError:
             error_message = str(e)
         raise HTTPException(status_code=e.response.status_code, detail=error_message)
+    except requests.exceptions.Timeout as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=504, detail=f"Timed out waiting for API: {e}")
+    except requests.exceptions.RequestException as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=500, detail=f"Error connecting to API: {e}")
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=500, detail="Error decoding API response")
+
+
+@traced("make_conditional_request", kind="client")
+def make_conditional_request(endpoint: str, etag: str = None):
+    """
+    GETs `endpoint` with If-None-Match so unchanged resources cost no payload.
+    Returns (payload, etag); payload is None when the upstream answered 304.
+    """
+    token = get_bearer_token()
+    breaker = circuit_breakers.for_endpoint(endpoint)
+    check_circuit(breaker)
+    headers = inject_trace_context({"Authorization": f"Bearer {token}"})
+    if etag:
+        headers["If-None-Match"] = etag
+    url = f"{TARGET_API_URL}{endpoint}"
+
+    started = time.monotonic()
+    try:
+        with track_upstream(endpoint_label(endpoint), "GET") as call:
+            response = requests.get(url, headers=headers, proxies=PROXIES, timeout=upstream_timeout())
+            call["status"] = response.status_code
+        set_span_attribute("http.status_code", response.status_code)
+        breaker.record(response.status_code < 500, time.monotonic() - started)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return loads(response.content), response.headers.get("ETag")
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
+        raise HTTPException(status_code=e.response.status_code, detail=str(e))
+    except requests.exceptions.Timeout as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=504, detail=f"Timed out waiting for API: {e}")
     except requests.exceptions.RequestException as e:
+        breaker.record(False, time.monotonic() - started)
         raise HTTPException(status_code=500, detail=f"Error connecting to API: {e}")
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail="Error decoding API response")
@@ -0,0 +1,206 @@
+# my-facade-api/src/adapters/async_api_client.py
+import os
+import json
+import time
+import httpx
+from fastapi import HTTPException
+
+try:
+    import h2  # Provided by the httpx[http2] extra.
+except ImportError:  # Without it httpx refuses http2=True; fall back to HTTP/1.1.
+    h2 = None
+
+from fastapi.concurrency import run_in_threadpool
+from src.adapters.api_client import (
+    CLIENT_ID,
+    SCOPE,
+    TARGET_API_URL,
+    PROXIES,
+    token_manager,
+    check_circuit,
+)
+from src.adapters.circuit_breaker import circuit_breakers
+from src.adapters.deadline import CONNECT_TIMEOUT, READ_TIMEOUT, upstream_timeout
+from src.adapters.serialization import loads
+from src.adapters.metrics import endpoint_label, track_upstream
+from src.adapters.tracing import inject_trace_context, set_span_attribute, traced
+
+HTTP2 = os.getenv("HTTP2", "true").lower() == "true"
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+_client = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    proxies = {f"{scheme}://": url for scheme, url in PROXIES.items() if url} or None
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+    http2 = HTTP2 and h2 is not None
+    if HTTP2 and not http2:
+        print("HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+    return httpx.AsyncClient(proxies=proxies, http2=http2, limits=limits, timeout=timeout)
+
+
+def request_timeout() -> httpx.Timeout:
+    """Per-call timeouts capped by what is left of the incoming request's deadline."""
+    connect, read = upstream_timeout()
+    return httpx.Timeout(read, connect=connect)
+
+
+async def open_async_client() -> httpx.AsyncClient:
+    """Opens the pooled upstream client. Called from the app lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def close_async_client():
+    """Closes the pooled upstream client. Called from the app lifespan."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Returns the pooled upstream client, creating it lazily outside the app lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+@traced("get_bearer_token")
+async def get_bearer_token_async() -> str:
+    """Returns the cached bearer token, running a blocking token fetch off the event loop when needed."""
+    token = token_manager.cached_token(CLIENT_ID, SCOPE)
+    if token:
+        return token
+    return await run_in_threadpool(token_manager.get_token, CLIENT_ID, SCOPE)
+
+
+@traced("make_api_request", kind="client")
+async def make_api_request_async(endpoint: str, method: str = "GET", params: dict = None, data: dict = None):
+    """Async counterpart of make_api_request, sharing its token cache and error handling."""
+    if method not in ("GET", "POST", "PATCH"):
+        raise HTTPException(status_code=405, detail=f"Method '{method}' not allowed")
+
+    token = await get_bearer_token_async()
+    breaker = circuit_breakers.for_endpoint(endpoint)
+    check_circuit(breaker)
+    headers = inject_trace_context({"Authorization": f"Bearer {token}"})
+    url = f"{TARGET_API_URL}{endpoint}"
+
+    started = time.monotonic()
+    try:
+        with track_upstream(endpoint_label(endpoint), method) as call:
+            response = await get_async_client().request(
+                method, url, headers=headers, params=params, json=data, timeout=request_timeout()
+            )
+            call["status"] = response.status_code
+        set_span_attribute("http.status_code", response.status_code)
+        breaker.record(response.status_code < 500, time.monotonic() - started)
+        response.raise_for_status()
+        return loads(response.content)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
+        try:
+            error_message = e.response.json()
+        except json.JSONDecodeError:
+            error_message = str(e)
+        raise HTTPException(status_code=e.response.status_code, detail=error_message)
+    except httpx.TimeoutException as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=504, detail=f"Timed out waiting for API: {e}")
+    except httpx.RequestError as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=500, detail=f"Error connecting to API: {e}")
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=500, detail="Error decoding API response")
+
+
+@traced("make_conditional_request", kind="client")
+async def make_conditional_request_async(endpoint: str, etag: str = None):
+    """Async counterpart of make_conditional_request. Returns (payload or None if unchanged, etag)."""
+    token = await get_bearer_token_async()
+    breaker = circuit_breakers.for_endpoint(endpoint)
+    check_circuit(breaker)
+    headers = inject_trace_context({"Authorization": f"Bearer {token}"})
+    if etag:
+        headers["If-None-Match"] = etag
+    url = f"{TARGET_API_URL}{endpoint}"
+
+    started = time.monotonic()
+    try:
+        with track_upstream(endpoint_label(endpoint), "GET") as call:
+            response = await get_async_client().get(url, headers=headers, timeout=request_timeout())
+            call["status"] = response.status_code
+        set_span_attribute("http.status_code", response.status_code)
+        breaker.record(response.status_code < 500, time.monotonic() - started)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return loads(response.content), response.headers.get("ETag")
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
+        raise HTTPException(status_code=e.response.status_code, detail=str(e))
+    except httpx.TimeoutException as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=504, detail=f"Timed out waiting for API: {e}")
+    except httpx.RequestError as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=500, detail=f"Error connecting to API: {e}")
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=500, detail="Error decoding API response")
+
+
+@traced("open_api_stream", kind="client")
+async def open_api_stream(endpoint: str, params: dict = None) -> httpx.Response:
+    """
+    GETs `endpoint` without reading the body. Returns the open response once the
+    status line and headers are in; the caller iterates the body and must aclose() it.
+    """
+    token = await get_bearer_token_async()
+    breaker = circuit_breakers.for_endpoint(endpoint)
+    check_circuit(breaker)
+    headers = inject_trace_context({"Authorization": f"Bearer {token}"})
+    url = f"{TARGET_API_URL}{endpoint}"
+
+    client = get_async_client()
+    request = client.build_request("GET", url, headers=headers, params=params, timeout=request_timeout())
+    started = time.monotonic()
+    try:
+        # Measures time to response headers; the body is streamed to the client afterwards.
+        with track_upstream(endpoint_label(endpoint), "GET") as call:
+            response = await client.send(request, stream=True)
+            call["status"] = response.status_code
+        set_span_attribute("http.status_code", response.status_code)
+    except httpx.TimeoutException as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=504, detail=f"Timed out waiting for API: {e}")
+    except httpx.RequestError as e:
+        breaker.record(False, time.monotonic() - started)
+        raise HTTPException(status_code=500, detail=f"Error connecting to API: {e}")
+    breaker.record(response.status_code < 500, time.monotonic() - started)
+
+    if response.status_code >= 400:
+        # Error bodies are small; read them so the detail matches make_api_request_async.
+        await response.aread()
+        await response.aclose()
+        if response.status_code == 401:
+            token_manager.invalidate(CLIENT_ID, SCOPE)
+        try:
+            error_message = response.json()
+        except json.JSONDecodeError:
+            error_message = response.text
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response
@@ -0,0 +1,63 @@
+# my-facade-api/src/adapters/deadline.py
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+# Total time an incoming request may spend on upstream work (token fetch, calls, retries, backoff).
+REQUEST_TIMEOUT_BUDGET = float(os.getenv("REQUEST_TIMEOUT_BUDGET", "30"))
+# Per-route budgets, longest matching path prefix wins. ROUTE_TIMEOUT_BUDGETS (JSON) adds to or
+# overrides these, e.g. '{"/collateral/collateralOverview:batchGet": 300}'.
+# A batch streams many reads, each bounded by its own REQUEST_TIMEOUT_BUDGET, so the stream gets longer.
+DEFAULT_ROUTE_TIMEOUT_BUDGETS = {"/collateral/collateralOverview:batchGet": 600}
+ROUTE_TIMEOUT_BUDGETS: Dict[str, float] = {
+    **DEFAULT_ROUTE_TIMEOUT_BUDGETS,
+    **json.loads(os.getenv("ROUTE_TIMEOUT_BUDGETS", "{}")),
+}
+CONNECT_TIMEOUT = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.getenv("UPSTREAM_READ_TIMEOUT", "10"))
+
+_deadline: ContextVar[Optional[float]] = ContextVar("upstream_deadline", default=None)
+
+
+def budget_for_path(path: str) -> float:
+    matches = [prefix for prefix in ROUTE_TIMEOUT_BUDGETS if path.startswith(prefix)]
+    if not matches:
+        return REQUEST_TIMEOUT_BUDGET
+    return float(ROUTE_TIMEOUT_BUDGETS[max(matches, key=len)])
+
+
+@contextmanager
+def request_deadline(budget: float):
+    """Sets the deadline for everything awaited or called inside the block. Nested deadlines can only shrink it."""
+    deadline = time.monotonic() + budget
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left before the current request's deadline, or None outside a request."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def upstream_timeout() -> Tuple[float, float]:
+    """(connect, read) timeouts for the next upstream call, capped by the remaining budget."""
+    remaining = remaining_budget()
+    if remaining is None:
+        return CONNECT_TIMEOUT, READ_TIMEOUT
+    if remaining <= 0:
+        raise HTTPException(status_code=504, detail="Request deadline exceeded before calling upstream")
+    return min(CONNECT_TIMEOUT, remaining), min(READ_TIMEOUT, remaining)
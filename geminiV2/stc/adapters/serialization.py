@@ -0,0 +1,72 @@
+# my-facade-api/src/adapters/serialization.py
+import json
+import os
+from typing import Any, Type, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from src.adapters.tracing import tracer
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback.
+    orjson = None
+
+# "orjson" or "json". Defaults to orjson when it is installed.
+JSON_SERIALIZER = os.getenv("JSON_SERIALIZER", "orjson" if orjson else "json")
+if JSON_SERIALIZER == "orjson" and orjson is None:
+    raise RuntimeError("JSON_SERIALIZER=orjson but orjson is not installed")
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def _default(obj: Any) -> Any:
+    """Handles what the serializer does not know natively (models, Decimal, ...)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json") if hasattr(obj, "model_dump") else jsonable_encoder(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    if JSON_SERIALIZER == "orjson":
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def loads(data) -> Any:
+    """Parses bytes or str. Raises json.JSONDecodeError (orjson's error subclasses it)."""
+    if JSON_SERIALIZER == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_model(model: BaseModel) -> bytes:
+    """Serializes a Pydantic model straight to JSON bytes, skipping the intermediate dict."""
+    if hasattr(model, "model_dump_json"):
+        return model.model_dump_json().encode()
+    return dumps(model.dict())
+
+
+def to_jsonable(model: BaseModel) -> Any:
+    """Plain JSON-compatible data for a model (enums as values), for request bodies sent upstream."""
+    if hasattr(model, "model_dump"):
+        return model.model_dump(mode="json")
+    return jsonable_encoder(model)
+
+
+def parse_model(model_class: Type[Model], data) -> Model:
+    """Validates raw JSON bytes into `model_class` without building an intermediate dict first."""
+    if hasattr(model_class, "model_validate_json"):
+        return model_class.model_validate_json(data)
+    return model_class.parse_raw(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class; Pydantic models in the content are dumped directly."""
+
+    def render(self, content: Any) -> bytes:
+        with tracer.start_span("encode"):
+            if isinstance(content, BaseModel):
+                return dump_model(content)
+            return dumps(content)
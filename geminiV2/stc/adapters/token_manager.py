@@ -0,0 +1,94 @@
+# my-facade-api/src/adapters/token_manager.py
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+# fetch_token(client_id, scope) -> (access_token, expires_in)
+TokenFetcher = Callable[[str, Optional[str]], Tuple[Optional[str], Optional[int]]]
+
+
+class CachedToken:
+    """A bearer token together with the monotonic times it should be refreshed and dropped."""
+
+    __slots__ = ("access_token", "refresh_at", "expires_at")
+
+    def __init__(self, access_token: str, refresh_at: float, expires_at: float):
+        self.access_token = access_token
+        self.refresh_at = refresh_at
+        self.expires_at = expires_at
+
+
+class TokenManager:
+    """
+    Caches bearer tokens per (client_id, scope).
+
+    Tokens are refreshed in a background thread once they enter the refresh
+    margin, and callers that find no usable token share a single in-flight fetch.
+    """
+
+    def __init__(self, fetch_token: TokenFetcher, refresh_margin: int = 60, default_expires_in: int = 300):
+        self._fetch_token = fetch_token
+        self._refresh_margin = refresh_margin
+        self._default_expires_in = default_expires_in
+        self._tokens: Dict[Tuple[str, Optional[str]], CachedToken] = {}
+        self._locks: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get_token(self, client_id: str, scope: Optional[str] = None) -> Optional[str]:
+        """Returns a valid token, fetching one only when none is cached or it has expired."""
+        access_token = self.cached_token(client_id, scope)
+        if access_token:
+            return access_token
+
+        key = (client_id, scope)
+        with self._lock_for(key):
+            # Another caller may have refreshed the token while we waited.
+            cached = self._tokens.get(key)
+            if cached and time.monotonic() < cached.expires_at:
+                return cached.access_token
+            return self._refresh(key)
+
+    def cached_token(self, client_id: str, scope: Optional[str] = None) -> Optional[str]:
+        """Returns the cached token without ever blocking on a fetch, or None if there is none."""
+        key = (client_id, scope)
+        cached = self._tokens.get(key)
+        now = time.monotonic()
+        if cached and now < cached.expires_at:
+            if now >= cached.refresh_at:
+                self._refresh_in_background(key)
+            return cached.access_token
+        return None
+
+    def invalidate(self, client_id: str, scope: Optional[str] = None) -> None:
+        """Drops the cached token, e.g. after the upstream rejected it with a 401."""
+        self._tokens.pop((client_id, scope), None)
+
+    def _lock_for(self, key) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _refresh(self, key) -> Optional[str]:
+        access_token, expires_in = self._fetch_token(*key)
+        if not access_token:
+            return None
+        expires_in = int(expires_in or self._default_expires_in)
+        now = time.monotonic()
+        # Short-lived tokens are refreshed half way through instead of never.
+        refresh_in = max(expires_in - self._refresh_margin, expires_in / 2)
+        self._tokens[key] = CachedToken(access_token, now + refresh_in, now + expires_in)
+        return access_token
+
+    def _refresh_in_background(self, key) -> None:
+        lock = self._lock_for(key)
+        if not lock.acquire(blocking=False):
+            return  # A refresh for this key is already in flight.
+
+        def refresh():
+            try:
+                self._refresh(key)
+            except Exception as e:
+                print(f"Background token refresh failed: {e}")
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
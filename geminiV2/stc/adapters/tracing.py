@@ -0,0 +1,183 @@
+# my-facade-api/src/adapters/tracing.py
+import functools
+import inspect
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+
+TRACEPARENT_HEADER = "traceparent"
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    One timed operation, shaped like an OpenTelemetry span (W3C trace/span IDs,
+    attributes, OK/ERROR status) so exporters can translate it directly.
+    """
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "attributes",
+                 "status", "start_ns", "end_ns", "root", "children")
+
+    def __init__(self, name: str, kind: str, trace_id: str, parent_id: Optional[str], root: Optional["Span"]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = {}
+        self.status = "UNSET"
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.root = root or self
+        self.children: List["Span"] = []  # finished descendants, only kept on the root
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": dict(self.attributes),
+            "status": self.status,
+        }
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in a list, for tests and debugging."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class Tracer:
+    """Creates spans that nest through a contextvar, so they follow awaits and run_in_threadpool."""
+
+    def __init__(self, enabled: bool = TRACING_ENABLED):
+        self.enabled = enabled
+        self.exporters: list = []
+
+    def add_exporter(self, exporter) -> None:
+        self.exporters.append(exporter)
+
+    def remove_exporter(self, exporter) -> None:
+        self.exporters.remove(exporter)
+
+    @contextmanager
+    def start_span(self, name: str, kind: str = "internal", traceparent: Optional[str] = None) -> Iterator[Optional[Span]]:
+        """
+        Times the block as a child of the current span. A span with no current parent
+        starts a new trace, continuing the caller's trace when `traceparent` is valid.
+        Yields None when tracing is disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+        parent = _current_span.get()
+        if parent is not None:
+            span = Span(name, kind, parent.trace_id, parent.span_id, parent.root)
+        else:
+            remote = parse_traceparent(traceparent)
+            trace_id, parent_id = remote if remote else (os.urandom(16).hex(), None)
+            span = Span(name, kind, trace_id, parent_id, None)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "ERROR"
+            span.set_attribute("exception.type", type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if span.status == "UNSET":
+                span.status = "OK"
+            if span.root is not span:
+                span.root.children.append(span)
+            for exporter in self.exporters:
+                exporter.export(span)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_span_attribute(key: str, value: Any) -> None:
+    """Sets an attribute on the current span, if there is one."""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+def traced(name: str, kind: str = "internal"):
+    """Decorator that runs each call of a sync or async function in its own span."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_span(name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.start_span(name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """(trace_id, parent span_id) from a W3C traceparent header, or None if absent or malformed."""
+    match = _TRACEPARENT.match(value.strip().lower()) if value else None
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2)
+
+
+def inject_trace_context(headers: Dict[str, str]) -> Dict[str, str]:
+    """Adds a traceparent for the current span so the upstream call joins the trace."""
+    span = _current_span.get()
+    if span is not None:
+        headers[TRACEPARENT_HEADER] = f"00-{span.trace_id}-{span.span_id}-01"
+    return headers
+
+
+def server_timing(root: Span) -> str:
+    """Server-Timing header value: total time plus the summed duration of each child span name."""
+    totals: Dict[str, float] = {}
+    for span in list(root.children):
+        totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+    metrics = [f"total;dur={root.duration_ms:.1f}"]
+    metrics.extend(f"{name};dur={duration:.1f}" for name, duration in totals.items())
+    return ", ".join(metrics)
+
+
+tracer = Tracer()
@@ -0,0 +1,45 @@
+# my-facade-api/src/domain/collateral/batch.py
+import asyncio
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Iterable, Tuple
+
+COLLATERAL_BATCH_CONCURRENCY = int(os.getenv("COLLATERAL_BATCH_CONCURRENCY", "16"))
+COLLATERAL_BATCH_MAX_ITEMS = int(os.getenv("COLLATERAL_BATCH_MAX_ITEMS", "5000"))
+
+
+async def fetch_concurrently(
+    keys: Iterable[Hashable],
+    fetch: Callable[[Hashable], Awaitable[Tuple[Any, int]]],
+    concurrency: int = COLLATERAL_BATCH_CONCURRENCY,
+) -> AsyncIterator[Tuple[Hashable, Any, int]]:
+    """
+    Runs `fetch(key)` for every key with at most `concurrency` calls in flight and
+    yields (key, result, status_code) in completion order. A failing fetch yields a
+    500 for its key (503 if it was cancelled) instead of aborting the batch.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    pending = list(dict.fromkeys(keys))
+    remaining = len(pending)
+
+    async def worker():
+        current = asyncio.current_task()
+        while pending:
+            key = pending.pop()
+            try:
+                result, status_code = await fetch(key)
+            except asyncio.CancelledError:
+                if current.cancelling():
+                    raise  # The batch itself is being torn down.
+                # A read cancelled under us (e.g. a shared read) still owes its key a line.
+                result, status_code = {"error": "Read was cancelled"}, 503
+            except Exception as e:
+                result, status_code = {"error": str(e)}, 500
+            await queue.put((key, result, status_code))
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, remaining))]
+    try:
+        for _ in range(remaining):
+            yield await queue.get()
+    finally:
+        for task in workers:
+            task.cancel()
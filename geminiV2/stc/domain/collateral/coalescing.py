@@ -0,0 +1,75 @@
+# my-facade-api/src/domain/collateral/coalescing.py
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set, Tuple
+from src.adapters.metrics import CACHE_REQUESTS
+
+COLLATERAL_OVERVIEW_CACHE_TTL = float(os.getenv("COLLATERAL_OVERVIEW_CACHE_TTL", "0"))
+
+Loader = Callable[[], Awaitable[Tuple[Any, int]]]
+
+
+class CoalescingReadCache:
+    """
+    Single-flight reads keyed by e.g. location_id, with an optional short-TTL cache.
+
+    Concurrent `get` calls for the same key share one `load()`; its (result, status_code)
+    is handed to every waiter, and a waiter being cancelled leaves the load running
+    for the others. Only 200 results are cached, and `invalidate` (called
+    after a write) makes the next read go upstream even if an older read is in flight.
+    """
+
+    def __init__(self, name: str, ttl: float = 0):
+        self.name = name
+        self.ttl = ttl
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._loads: Set[asyncio.Task] = set()  # Strong references until each load finishes.
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generations: Dict[Hashable, int] = {}
+
+    async def get(self, key: Hashable, load: Loader) -> Tuple[Any, int]:
+        cached = self._cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                CACHE_REQUESTS.labels(cache=self.name, result="hit").inc()
+                return cached[1], 200
+            del self._cache[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            CACHE_REQUESTS.labels(cache=self.name, result="coalesced").inc()
+            return await asyncio.shield(inflight)
+
+        CACHE_REQUESTS.labels(cache=self.name, result="miss").inc()
+        # The load runs in its own task that every caller shields, so a caller going away
+        # (the first one included) never cancels the read for the others.
+        task = asyncio.create_task(self._load(key, load))
+        self._inflight[key] = task
+        self._loads.add(task)
+        task.add_done_callback(self._load_done)
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, load: Loader) -> Tuple[Any, int]:
+        generation = self._generations.get(key, 0)
+        try:
+            result, status_code = await load()
+            if self.ttl and status_code == 200 and generation == self._generations.get(key, 0):
+                self._cache[key] = (time.monotonic() + self.ttl, result)
+            return result, status_code
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def _load_done(self, task: asyncio.Task) -> None:
+        self._loads.discard(task)
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved when every caller has gone.
+
+    def invalidate(self, key: Hashable) -> None:
+        self._cache.pop(key, None)
+        self._inflight.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+
+collateral_overview_reads = CoalescingReadCache("collateral_overview_reads", ttl=COLLATERAL_OVERVIEW_CACHE_TTL)
@@ -0,0 +1,80 @@
+# my-facade-api/src/domain/collateral/diff.py
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+# Fields that identify a collateral across versions of an overview; the first one present is used.
+COLLATERAL_IDENTITY_FIELDS = [
+    name.strip() for name in os.getenv("COLLATERAL_IDENTITY_FIELDS", "collateralID").split(",") if name.strip()
+]
+
+
+def changed_fields(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of `after` whose value differs from (or is missing in) `before`."""
+    return {key: value for key, value in after.items() if key not in before or before[key] != value}
+
+
+def collateral_identity(collateral: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+    for field in COLLATERAL_IDENTITY_FIELDS:
+        if collateral.get(field) is not None:
+            return field, collateral[field]
+    return None
+
+
+def _index_by_identity(collaterals: List[Dict[str, Any]]) -> Optional[Dict[Tuple[str, Any], Dict[str, Any]]]:
+    """Collaterals keyed by identity, or None when one lacks an identity or two share it."""
+    indexed = {}
+    for collateral in collaterals:
+        identity = collateral_identity(collateral)
+        if identity is None or identity in indexed:
+            return None
+        indexed[identity] = collateral
+    return indexed
+
+
+def diff_collaterals(before: List[Dict[str, Any]], after: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Collateral entries that changed between two versions: new collaterals in full,
+    existing ones as their identity plus changed fields. Returns None when nothing
+    changed (order is not significant), and the whole of `after` when the difference
+    cannot be expressed that way (a removal, or collaterals without a unique identity),
+    since a partial list would silently keep the removed entries.
+    """
+    if before == after:
+        return None
+    old = _index_by_identity(before)
+    new = _index_by_identity(after)
+    if old is None or new is None or not old.keys() <= new.keys():
+        return after
+
+    changes = []
+    for identity, collateral in new.items():
+        if identity not in old:
+            changes.append(collateral)
+            continue
+        fields = changed_fields(old[identity], collateral)
+        if fields:
+            changes.append({identity[0]: identity[1], **fields})
+    return changes or None
+
+
+def diff_collateral_overview(baseline: Dict[str, Any], updated: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Minimal PATCH body taking `baseline` (the last-known upstream overview) to `updated`.
+    Both are JSON-compatible CollateralOverview dumps. Returns None when the data is
+    unchanged; `meta` is not compared but always sent, as it carries the editor.
+    """
+    before = baseline.get("data") or {}
+    after = updated.get("data") or {}
+    data = {}
+
+    transaction = changed_fields(before.get("transaction") or {}, after.get("transaction") or {})
+    if transaction:
+        data["transaction"] = transaction
+
+    collaterals = diff_collaterals(before.get("collaterals") or [], after.get("collaterals") or [])
+    if collaterals is not None:
+        data["collaterals"] = collaterals
+
+    if not data:
+        return None
+    return {"meta": updated.get("meta"), "data": data}
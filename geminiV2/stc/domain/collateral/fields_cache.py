@@ -0,0 +1,92 @@
+# my-facade-api/src/domain/collateral/fields_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.adapters.api_client import make_conditional_request
+from src.adapters.async_api_client import make_conditional_request_async
+from src.domain.collateral.models import extract_field_definitions, build_collateral_models
+
+FIELDS_ENDPOINT = "/collateralOverview/fields"
+FIELDS_CACHE_PATH = os.getenv("COLLATERAL_FIELDS_CACHE_PATH", ".cache/collateral_fields.json")
+# Bump when the layout of the cache file or of the derived definitions changes.
+FIELDS_CACHE_FORMAT = 1
+
+
+def fields_checksum(fields_data: Dict[str, Any]) -> str:
+    canonical = json.dumps(fields_data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def build_cache_entry(fields_data: Dict[str, Any], etag: Optional[str]) -> Dict[str, Any]:
+    return {
+        "format": FIELDS_CACHE_FORMAT,
+        "etag": etag,
+        "checksum": fields_checksum(fields_data),
+        "fetched_at": time.time(),
+        "fields": fields_data,
+        "definitions": extract_field_definitions(fields_data),
+    }
+
+
+def read_fields_cache(path: str = FIELDS_CACHE_PATH) -> Optional[Dict[str, Any]]:
+    """Returns the cached entry, or None if the file is missing, from another format or corrupt."""
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if entry.get("format") != FIELDS_CACHE_FORMAT or "definitions" not in entry:
+        return None
+    if entry.get("checksum") != fields_checksum(entry.get("fields", {})):
+        print(f"Ignoring collateral fields cache {path}: checksum mismatch")
+        return None
+    return entry
+
+
+def write_fields_cache(entry: Dict[str, Any], path: str = FIELDS_CACHE_PATH) -> None:
+    """Writes the entry atomically so concurrently starting workers never read a partial file."""
+    directory = os.path.dirname(path) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error writing collateral fields cache {path}: {e}")
+
+
+def load_collateral_models() -> Tuple[tuple, Dict[str, Any]]:
+    """
+    Returns (models, cache entry) for startup.
+
+    Uses the on-disk cache when present so no upstream call is needed before the
+    app can serve; otherwise fetches the fields synchronously and seeds the cache.
+    """
+    entry = read_fields_cache()
+    if entry is None:
+        fields_data, etag = make_conditional_request(FIELDS_ENDPOINT)
+        entry = build_cache_entry(fields_data, etag)
+        write_fields_cache(entry)
+    return build_collateral_models(entry["definitions"]), entry
+
+
+async def revalidate_collateral_fields(entry: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Conditionally re-fetches the fields payload and refreshes the cache file.
+    Returns (current entry, changed) where changed means the fields differ from `entry`.
+    """
+    entry = entry or read_fields_cache()
+    fields_data, etag = await make_conditional_request_async(FIELDS_ENDPOINT, etag=entry and entry.get("etag"))
+    if fields_data is None:
+        return entry, False
+
+    new_entry = build_cache_entry(fields_data, etag)
+    changed = entry is None or new_entry["checksum"] != entry["checksum"]
+    if changed or new_entry["etag"] != entry.get("etag"):
+        write_fields_cache(new_entry)
+    return new_entry, changed
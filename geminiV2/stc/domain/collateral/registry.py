@@ -0,0 +1,96 @@
+# my-facade-api/src/domain/collateral/registry.py
+import asyncio
+import os
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Type
+
+from pydantic import BaseModel
+from src.domain.collateral.models import build_collateral_models
+from src.domain.collateral.fields_cache import load_collateral_models, revalidate_collateral_fields
+
+COLLATERAL_FIELDS_REVALIDATE_INTERVAL = int(os.getenv("COLLATERAL_FIELDS_REVALIDATE_INTERVAL", "300"))
+
+
+class CollateralModelSet(NamedTuple):
+    """The models compiled from one version of the collateral fields schema."""
+
+    version: str
+    TransactionData: Type[BaseModel]
+    CollateralItem: Type[BaseModel]
+    MetaData: Type[BaseModel]
+    CollateralData: Type[BaseModel]
+    CollateralOverview: Type[BaseModel]
+    CollateralPatchSuccess: Type[BaseModel]
+    CollateralPatchFailure: Type[BaseModel]
+
+
+class ModelRegistry:
+    """
+    Holds the current CollateralModelSet and replaces it atomically when the fields schema changes.
+
+    Routes call `current()` per request instead of binding models at import time,
+    so a new schema takes effect without restarting workers.
+    """
+
+    def __init__(self):
+        self._current: Optional[CollateralModelSet] = None
+        self._entry: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> CollateralModelSet:
+        models = self._current
+        if models is None:
+            with self._lock:
+                if self._current is None:
+                    self._load()
+                models = self._current
+        return models
+
+    def load(self) -> CollateralModelSet:
+        """Loads the model set from the fields cache, or from upstream when there is none."""
+        with self._lock:
+            self._load()
+            return self._current
+
+    def swap(self, entry: Dict[str, Any]) -> bool:
+        """Compiles and installs the models for a fields cache entry. Returns False if that version is already live."""
+        with self._lock:
+            if self._current is not None and self._current.version == entry["checksum"]:
+                self._entry = entry  # Same models; keep the newer ETag.
+                return False
+            self._install(build_collateral_models(entry["definitions"]), entry)
+            return True
+
+    async def revalidate(self) -> bool:
+        """Checks upstream for a new fields schema and swaps it in. Returns True if the models changed."""
+        entry, changed = await revalidate_collateral_fields(self._entry)
+        if changed:
+            return self.swap(entry)
+        if entry is not None:
+            # Only the ETag may have moved; the next check must be conditional on the new one.
+            with self._lock:
+                self._entry = entry
+        return False
+
+    async def watch(self, interval: int = COLLATERAL_FIELDS_REVALIDATE_INTERVAL):
+        """Revalidates immediately and then every `interval` seconds until cancelled."""
+        while True:
+            try:
+                if await self.revalidate():
+                    print(f"Collateral models swapped to version {self._current.version[:12]}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error revalidating collateral fields: {e}")
+            await asyncio.sleep(interval)
+
+    def _load(self):
+        models, entry = load_collateral_models()
+        self._install(models, entry)
+
+    def _install(self, models: tuple, entry: Dict[str, Any]):
+        self._entry = entry
+        self._current = CollateralModelSet(entry["checksum"], *models)
+
+
+model_registry = ModelRegistry()
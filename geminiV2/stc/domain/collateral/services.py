@@ -1,5 +1,6 @@
 # my-facade-api/src/domain/collateral/services.py
 from src.adapters.api_client import make_api_request
+from src.adapters.async_api_client import make_api_request_async, open_api_stream
 from fastapi import HTTPException
 from typing import Tuple, Dict, Any
 
@@ -38,3 +39,53 @@ def get_collateral_fields() -> Tuple[Dict[str, Any], int]:
         return {"error": e.detail}, e.status_code
     except Exception as e:
         return {"error": str(e)}, 500
+
+
+async def get_collateral_overview_async(location_id: int) -> Tuple[Dict[str, Any], int]:
+    """
+    Retrieves the collateral overview for a specific location without blocking the event loop.
+    """
+    try:
+        response = await make_api_request_async(f"/collateralOverview/{location_id}")
+        return response, 200
+    except HTTPException as e:
+        return {"error": e.detail}, e.status_code
+    except Exception as e:
+        return {"error": str(e)}, 500
+
+async def open_collateral_overview_stream(location_id: int):
+    """
+    Opens the upstream collateral overview without parsing it, for passthrough responses.
+    Raises HTTPException on upstream errors, with the detail wrapped as {"error": ...}
+    like get_collateral_overview_async; the caller must aclose() the returned response.
+    """
+    try:
+        return await open_api_stream(f"/collateralOverview/{location_id}")
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail={"error": e.detail}, headers=e.headers)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail={"error": str(e)})
+
+async def patch_collateral_overview_async(location_id: int, data: dict) -> Tuple[Dict[str, Any], int]:
+    """
+    Updates the collateral overview for a specific location without blocking the event loop.
+    """
+    try:
+        response = await make_api_request_async(f"/collateralOverview/{location_id}", method="PATCH", data=data)
+        return response, 200
+    except HTTPException as e:
+        return {"error": e.detail}, e.status_code
+    except Exception as e:
+        return {"error": str(e)}, 500
+
+async def get_collateral_fields_async() -> Tuple[Dict[str, Any], int]:
+    """
+    Retrieves the field definitions for collateral data without blocking the event loop.
+    """
+    try:
+        response = await make_api_request_async("/collateralOverview/fields")
+        return response, 200
+    except HTTPException as e:
+        return {"error": e.detail}, e.status_code
+    except Exception as e:
+        return {"error": str(e)}, 500
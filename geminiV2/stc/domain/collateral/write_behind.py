@@ -0,0 +1,103 @@
+# my-facade-api/src/domain/collateral/write_behind.py
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set, Tuple
+from src.adapters.metrics import WRITE_BATCH_SIZE
+
+# Seconds an edit waits for later edits to the same location; 0 disables coalescing.
+COLLATERAL_WRITE_COALESCING_WINDOW = float(os.getenv("COLLATERAL_WRITE_COALESCING_WINDOW", "0"))
+
+Writer = Callable[[Any], Awaitable[Tuple[Any, int]]]
+
+
+class _Batch:
+    __slots__ = ("data", "write", "size", "future", "wake")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.data = None
+        self.write = None
+        self.size = 0
+        self.future = loop.create_future()
+        self.wake = loop.create_future()  # Resolved to flush before the window ends.
+
+
+class WriteCoalescingQueue:
+    """
+    Write-behind coalescing keyed by e.g. location_id.
+
+    An edit opens a batch that stays open for `window` seconds; later edits to the same
+    key replace its document (last writer wins) and join it. The batch is then written
+    with one `write(data)` call and every caller gets that call's (result, status_code).
+    Writes for a key run one at a time in the order their batches opened, so a batch
+    that closes while the previous one is still being written waits for it.
+    """
+
+    def __init__(self, name: str, window: float = 0):
+        self.name = name
+        self.window = window
+        self._pending: Dict[Hashable, _Batch] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._draining = False
+
+    async def submit(self, key: Hashable, data: Any, write: Writer) -> Tuple[Any, int]:
+        if self.window <= 0:
+            return await write(data)
+        batch = self._pending.get(key)
+        if batch is None and self._draining:
+            async with self._lock(key):
+                return await write(data)
+
+        # While draining, an edit still joins the open batch so it cannot be overtaken by it.
+        if batch is None:
+            batch = self._pending[key] = _Batch(asyncio.get_running_loop())
+            task = asyncio.create_task(self._flush_after_window(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        batch.data = data
+        batch.write = write
+        batch.size += 1
+        # A caller that goes away does not take the write down with it.
+        return await asyncio.shield(batch.future)
+
+    async def drain(self) -> None:
+        """Flushes every open batch now and waits for the writes. Called from the app lifespan."""
+        self._draining = True
+        try:
+            while self._tasks:
+                for batch in self._pending.values():
+                    if not batch.wake.done():
+                        batch.wake.set_result(None)
+                await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        finally:
+            self._draining = False
+
+    def _lock(self, key: Hashable) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def _flush_after_window(self, key: Hashable, batch: _Batch) -> None:
+        await asyncio.wait([batch.wake], timeout=self.window)
+        lock = self._lock(key)
+        async with lock:
+            # Edits arriving from here on open the next batch.
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+            WRITE_BATCH_SIZE.labels(queue=self.name).observe(batch.size)
+            try:
+                result = await batch.write(batch.data)
+            except Exception as e:
+                batch.future.set_exception(e)
+                batch.future.exception()  # Mark as retrieved when every caller has gone.
+            else:
+                batch.future.set_result(result)
+        # Only a pending batch can be waiting for the lock, so with none left it can go.
+        if key not in self._pending and not lock.locked():
+            self._locks.pop(key, None)
+
+
+collateral_overview_writes = WriteCoalescingQueue(
+    "collateral_overview_writes", window=COLLATERAL_WRITE_COALESCING_WINDOW
+)
@@ -1,80 +1,204 @@
 # my-facade-api/src/presentation/collateral_router.py
-from fastapi import APIRouter, HTTPException, Depends
-from src.domain.collateral.services import get_collateral_overview, patch_collateral_overview, get_collateral_fields
-from src.domain.collateral.models import CollateralOverview, generate_collateral_models
-from typing import Annotated, Optional
-from fastapi.responses import JSONResponse
-import yaml
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from starlette.background import BackgroundTask
+from src.domain.collateral.services import (
+    get_collateral_overview_async,
+    open_collateral_overview_stream,
+    patch_collateral_overview_async,
+    get_collateral_fields_async,
+)
+from src.adapters.circuit_breaker import circuit_breakers
+from src.adapters.deadline import REQUEST_TIMEOUT_BUDGET, request_deadline
+from src.adapters.serialization import FastJSONResponse, dumps, parse_model, to_jsonable
+from src.adapters.tracing import tracer
+from src.domain.collateral.registry import model_registry
+from src.domain.collateral.coalescing import collateral_overview_reads
+from src.domain.collateral.diff import diff_collateral_overview
+from src.domain.collateral.write_behind import collateral_overview_writes
+from src.domain.collateral.batch import fetch_concurrently, COLLATERAL_BATCH_MAX_ITEMS
+from src.presentation.openapi_cache import openapi_spec_cache, conditional_response
+from typing import Annotated, List, Optional
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+import os
 import random
 import string
 
 router = APIRouter()
 
-# Generate models dynamically
-(
-    TransactionData,
-    CollateralItem,
-    MetaData,
-    CollateralData,
-    CollateralOverview,
-    CollateralPatchSuccess,
-    CollateralPatchFailure,
-) = generate_collateral_models(dynamic=True)
+# Serve collateral overviews as the raw upstream bytes unless the caller asks otherwise.
+COLLATERAL_OVERVIEW_PASSTHROUGH = os.getenv("COLLATERAL_OVERVIEW_PASSTHROUGH", "false").lower() == "true"
 
+# PATCH only the fields that differ from the current upstream overview (costs a GET per PATCH).
+COLLATERAL_PATCH_DIFF = os.getenv("COLLATERAL_PATCH_DIFF", "false").lower() == "true"
 
-@router.get("/collateralOverview/{location_id}")
-async def read_collateral_overview(location_id: int):
+# Load the current model set (from the on-disk fields cache when available);
+# routes resolve models through the registry so schema changes apply without a restart.
+model_registry.load()
+
+
+async def load_collateral_overview(location_id: int):
     """
-    Retrieves the collateral overview for a specific location.
+    Fetches and validates the collateral overview. Returns (CollateralOverview or error detail, status_code).
     """
-    result, status_code = get_collateral_overview(location_id)
+    models = model_registry.current()
+    result, status_code = await get_collateral_overview_async(location_id)
     if status_code == 200:
         try:
-            collateral_overview = CollateralOverview(**result)
-            return jsonable_encoder(collateral_overview)
+            with tracer.start_span("validate"):
+                return models.CollateralOverview(**result), 200
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+            return str(e), 400
+    return result, status_code
+
+
+@router.get("/collateralOverview/{location_id}")
+async def read_collateral_overview(location_id: int, passthrough: bool = Query(COLLATERAL_OVERVIEW_PASSTHROUGH)):
+    """
+    Retrieves the collateral overview for a specific location.
+    Concurrent reads of the same location share one upstream call.
+
+    With `passthrough`, the upstream body is streamed to the client as it arrives
+    without being parsed or validated, so large overviews never sit in memory whole.
+    """
+    if passthrough:
+        upstream = await open_collateral_overview_stream(location_id)
+        return StreamingResponse(
+            upstream.aiter_bytes(),
+            media_type=upstream.headers.get("Content-Type", "application/json"),
+            background=BackgroundTask(upstream.aclose),
+        )
+
+    result, status_code = await collateral_overview_reads.get(
+        location_id, lambda: load_collateral_overview(location_id)
+    )
+    if status_code == 200:
+        return FastJSONResponse(result)
     raise HTTPException(status_code=status_code, detail=result)
 
 
-@router.patch("/collateralOverview/{location_id}")
-async def update_collateral_overview(location_id: int, collateral_overview: CollateralOverview):
+class BatchGetRequest(BaseModel):
+    locationIds: List[int]
+
+
+@router.post("/collateralOverview:batchGet")
+async def batch_read_collateral_overviews(request: BatchGetRequest):
+    """
+    Retrieves collateral overviews for many locations, streamed back as NDJSON in completion order.
+    Each line is {"locationId", "status", "data"} on success or {"locationId", "status", "error"}.
+    """
+    if len(request.locationIds) > COLLATERAL_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {COLLATERAL_BATCH_MAX_ITEMS} locationIds per batch")
+
+    async def read(location_id: int):
+        # Each item gets a full request budget, capped by what is left of the batch's own.
+        with request_deadline(REQUEST_TIMEOUT_BUDGET):
+            return await collateral_overview_reads.get(location_id, lambda: load_collateral_overview(location_id))
+
+    async def stream_results():
+        async for location_id, result, status_code in fetch_concurrently(request.locationIds, read):
+            item = {"locationId": location_id, "status": status_code}
+            item["data" if status_code == 200 else "error"] = result
+            yield dumps(item) + b"\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+@router.patch(
+    "/collateralOverview/{location_id}",
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": {"type": "object"}}}}},
+)
+async def update_collateral_overview(location_id: int, request: Request):
     """
     Updates the collateral overview for a specific location.
+    The raw body is validated straight into the current CollateralOverview model.
+
+    With COLLATERAL_WRITE_COALESCING_WINDOW set, edits to the same location arriving
+    within the window are merged into one upstream PATCH (the last edit wins) and every
+    caller receives that PATCH's result.
     """
-    data = collateral_overview.dict()
-    result, status_code = patch_collateral_overview(location_id, data)
+    models = model_registry.current()
+    body = await request.body()
+    try:
+        with tracer.start_span("validate"):
+            collateral_overview = parse_model(models.CollateralOverview, body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=jsonable_encoder(e.errors()))
+    data = to_jsonable(collateral_overview)
+    result, status_code = await collateral_overview_writes.submit(
+        location_id, data, lambda merged: write_collateral_overview(location_id, merged)
+    )
     if status_code == 200:
-        return result
+        return FastJSONResponse(result)
     raise HTTPException(status_code=status_code, detail=result)
 
 
+async def write_collateral_overview(location_id: int, data: dict):
+    """
+    Sends one validated overview upstream. Returns (result, status_code).
+    With COLLATERAL_PATCH_DIFF only the fields that differ from the upstream overview
+    are sent, and an unchanged overview is answered without a PATCH. The baseline is
+    always read from upstream, never from the read cache, so a stale copy cannot make
+    an edit look like a no-op.
+    """
+    if COLLATERAL_PATCH_DIFF:
+        baseline, baseline_status = await load_collateral_overview(location_id)
+        # Without a readable baseline the full document is sent, as before.
+        if baseline_status == 200:
+            with tracer.start_span("diff"):
+                data = diff_collateral_overview(to_jsonable(baseline), data)
+            if data is None:
+                return unchanged_patch_response(location_id), 200
+
+    result, status_code = await patch_collateral_overview_async(location_id, data)
+    collateral_overview_reads.invalidate(location_id)
+    return result, status_code
+
+
+def unchanged_patch_response(location_id: int) -> dict:
+    """The PATCH-shaped {meta, data} answer for an edit that changes nothing upstream."""
+    return {
+        "meta": {"function": "update", "responseCode": 200, "success": True, "warnings": []},
+        "data": {"locationID": location_id},
+    }
+
+
 @router.get("/fields")
 async def read_collateral_fields():
     """
     Retrieves the field definitions for collateral data.
     """
-    result, status_code = get_collateral_fields()
+    result, status_code = await get_collateral_fields_async()
     if status_code == 200:
-        return result
+        return FastJSONResponse(result)
     raise HTTPException(status_code=status_code, detail=result)
 
 
-@router.get("/openapi.yaml", response_class=fastapi.responses.PlainTextResponse)
-async def get_openapi_spec():
+@router.get("/circuit-breakers")
+async def read_circuit_breakers():
     """
-    Generates the OpenAPI specification for the collateral API.
+    Reports the state of the upstream circuit breakers per endpoint group.
     """
-    from fastapi.openapi.utils import get_openapi
-    openapi_schema = get_openapi(
-        title="Collateral Overview API",
-        version="1.0.0",
-        routes=app.routes,
-    )
-    yaml_data = yaml.dump(openapi_schema)
-    return yaml_data
+    return circuit_breakers.snapshot()
+
+
+@router.get("/openapi.yaml", response_class=Response)
+async def get_openapi_spec(request: Request):
+    """
+    Returns the OpenAPI specification for the collateral API as YAML.
+    """
+    spec = openapi_spec_cache.get(request.app, model_registry.current())
+    return conditional_response(request, spec.yaml, "application/yaml", spec.yaml_etag)
+
+
+@router.get("/openapi.json", response_class=Response)
+async def get_openapi_spec_json(request: Request):
+    """
+    Returns the OpenAPI specification for the collateral API as JSON.
+    """
+    spec = openapi_spec_cache.get(request.app, model_registry.current())
+    return conditional_response(request, spec.json, "application/json", spec.json_etag)
 
 
 # Mock data generation
@@ -110,7 +234,8 @@ async def create_service_request(processAsWarnings: Optional[bool] = True):
         "srfAction": "DRAFT",
         "processAsWarnings": processAsWarnings,
     }
-    mock_transaction = generate_mock_data(TransactionData)
+    models = model_registry.current()
+    mock_transaction = generate_mock_data(models.TransactionData)
     mock_services = [
         {
             "serviceType": "MockAppraisal",
@@ -122,7 +247,7 @@ async def create_service_request(processAsWarnings: Optional[bool] = True):
     ]
     mock_collaterals = [
         {
-            **generate_mock_data(CollateralItem),
+            **generate_mock_data(models.CollateralItem),
             "services": mock_services,
         }
         for _ in range(random.randint(1, 3))
@@ -0,0 +1,88 @@
+# my-facade-api/src/presentation/openapi_cache.py
+import hashlib
+import json
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+import yaml
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.utils import get_openapi
+from src.domain.collateral.registry import CollateralModelSet
+
+OVERVIEW_PATH = "/collateral/collateralOverview/{location_id}"
+
+
+class RenderedSpec(NamedTuple):
+    version: str
+    yaml: bytes
+    json: bytes
+    yaml_etag: str
+    json_etag: str
+
+
+def build_openapi_spec(app: FastAPI, models: CollateralModelSet) -> Dict[str, Any]:
+    """Builds the OpenAPI document for the app, with the collateral schemas of the given model set."""
+    spec = get_openapi(title="Collateral Overview API", version="1.0.0", routes=app.routes)
+
+    overview_schema = models.CollateralOverview.schema(ref_template="#/components/schemas/{model}")
+    definitions = overview_schema.pop("definitions", None) or overview_schema.pop("$defs", {})
+    schemas = spec.setdefault("components", {}).setdefault("schemas", {})
+    schemas.update(definitions)
+    schemas["CollateralOverview"] = overview_schema
+
+    # The routes validate against the registry at request time, so their schemas are filled in here.
+    overview_ref = {"$ref": "#/components/schemas/CollateralOverview"}
+    operations = spec.get("paths", {}).get(OVERVIEW_PATH, {})
+    if "get" in operations:
+        operations["get"].setdefault("responses", {})["200"] = {
+            "description": "Successful Response",
+            "content": {"application/json": {"schema": overview_ref}},
+        }
+    if "patch" in operations:
+        operations["patch"]["requestBody"] = {
+            "required": True,
+            "content": {"application/json": {"schema": overview_ref}},
+        }
+    return spec
+
+
+class OpenAPISpecCache:
+    """Renders the OpenAPI document to YAML and JSON once per model registry version."""
+
+    def __init__(self):
+        self._rendered: Optional[RenderedSpec] = None
+        self._lock = threading.Lock()
+
+    def get(self, app: FastAPI, models: CollateralModelSet) -> RenderedSpec:
+        rendered = self._rendered
+        if rendered is not None and rendered.version == models.version:
+            return rendered
+        with self._lock:
+            if self._rendered is None or self._rendered.version != models.version:
+                self._rendered = self._render(app, models)
+            return self._rendered
+
+    @staticmethod
+    def _render(app: FastAPI, models: CollateralModelSet) -> RenderedSpec:
+        spec = build_openapi_spec(app, models)
+        json_bytes = json.dumps(spec, separators=(",", ":")).encode()
+        yaml_bytes = yaml.dump(spec, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper)).encode()
+        return RenderedSpec(models.version, yaml_bytes, json_bytes, content_etag(yaml_bytes), content_etag(json_bytes))
+
+
+def content_etag(content: bytes) -> str:
+    """Strong ETag for one representation; each media type needs its own, as the bytes differ."""
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def conditional_response(request: Request, content: bytes, media_type: str, etag: str) -> Response:
+    """Returns 304 when the client already has this ETag, the content otherwise."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+openapi_spec_cache = OpenAPISpecCache()
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The app lives in geminiV2/stc but imports itself as the `src` package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stc  # noqa: E402
+
+sys.modules.setdefault("src", stc)
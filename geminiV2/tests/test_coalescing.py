@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from src.domain.collateral.coalescing import CoalescingReadCache
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_reads_share_one_load():
+    async def scenario():
+        cache = CoalescingReadCache("test")
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": 1}, 200
+
+        results = await asyncio.gather(*(cache.get(1, load) for _ in range(5)))
+        return calls, results
+
+    calls, results = run(scenario())
+    assert len(calls) == 1
+    assert results == [({"id": 1}, 200)] * 5
+
+
+def test_cancelling_the_leading_caller_does_not_cancel_the_others():
+    async def scenario():
+        cache = CoalescingReadCache("test")
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "overview", 200
+
+        leader = asyncio.create_task(cache.get(1, load))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(cache.get(1, load)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert run(scenario()) == [("overview", 200), ("overview", 200)]
+
+
+def test_cancelled_follower_leaves_the_load_running():
+    async def scenario():
+        cache = CoalescingReadCache("test")
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "overview", 200
+
+        leader = asyncio.create_task(cache.get(1, load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get(1, load))
+        await asyncio.sleep(0)
+        follower.cancel()
+        release.set()
+        return await leader
+
+    assert run(scenario()) == ("overview", 200)
+
+
+def test_invalidate_makes_the_next_read_load_again():
+    async def scenario():
+        cache = CoalescingReadCache("test", ttl=60)
+        versions = iter(["v1", "v2"])
+
+        async def load():
+            return next(versions), 200
+
+        first = await cache.get(1, load)
+        cached = await cache.get(1, load)
+        cache.invalidate(1)
+        return first, cached, await cache.get(1, load)
+
+    assert run(scenario()) == (("v1", 200), ("v1", 200), ("v2", 200))
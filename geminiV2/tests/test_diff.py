@@ -0,0 +1,65 @@
+from src.domain.collateral.diff import diff_collateral_overview, diff_collaterals
+
+META = {"updatedBy": "editor@example.com"}
+
+
+def overview(transaction, collaterals, meta=META):
+    return {"meta": meta, "data": {"transaction": transaction, "collaterals": collaterals}}
+
+
+BASELINE = overview(
+    {"loanNumber": "L-1", "loanAmount": 100},
+    [{"collateralID": 1, "city": "Austin"}, {"collateralID": 2, "city": "Dallas"}],
+)
+
+
+def test_unchanged_overview_has_no_diff():
+    updated = overview(dict(BASELINE["data"]["transaction"]), [dict(c) for c in BASELINE["data"]["collaterals"]])
+    assert diff_collateral_overview(BASELINE, updated) is None
+
+
+def test_unchanged_data_with_a_new_editor_has_no_diff():
+    updated = overview(BASELINE["data"]["transaction"], BASELINE["data"]["collaterals"], {"updatedBy": "other@example.com"})
+    assert diff_collateral_overview(BASELINE, updated) is None
+
+
+def test_collateral_order_is_not_a_change():
+    updated = overview(BASELINE["data"]["transaction"], list(reversed(BASELINE["data"]["collaterals"])))
+    assert diff_collateral_overview(BASELINE, updated) is None
+
+
+def test_only_changed_fields_are_sent_with_meta():
+    updated = overview(
+        {"loanNumber": "L-1", "loanAmount": 250},
+        [{"collateralID": 1, "city": "Austin"}, {"collateralID": 2, "city": "Houston"}],
+    )
+    assert diff_collateral_overview(BASELINE, updated) == {
+        "meta": META,
+        "data": {
+            "transaction": {"loanAmount": 250},
+            "collaterals": [{"collateralID": 2, "city": "Houston"}],
+        },
+    }
+
+
+def test_new_collateral_is_sent_in_full():
+    added = {"collateralID": 3, "city": "El Paso"}
+    updated = overview(BASELINE["data"]["transaction"], BASELINE["data"]["collaterals"] + [added])
+    assert diff_collateral_overview(BASELINE, updated) == {"meta": META, "data": {"collaterals": [added]}}
+
+
+def test_removed_collateral_sends_the_whole_list():
+    remaining = [{"collateralID": 1, "city": "Austin"}]
+    assert diff_collaterals(BASELINE["data"]["collaterals"], remaining) == remaining
+
+
+def test_collaterals_without_identity_send_the_whole_list():
+    before = [{"city": "Austin"}]
+    after = [{"city": "Houston"}]
+    assert diff_collaterals(before, after) == after
+
+
+def test_duplicate_identities_send_the_whole_list():
+    before = [{"collateralID": 1, "city": "Austin"}]
+    after = [{"collateralID": 1, "city": "Austin"}, {"collateralID": 1, "city": "Dallas"}]
+    assert diff_collaterals(before, after) == after
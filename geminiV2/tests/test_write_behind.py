@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from src.domain.collateral.write_behind import WriteCoalescingQueue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class Recorder:
+    """A writer that records every document it is asked to write."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.writes = []
+
+    async def __call__(self, data):
+        self.writes.append(data)
+        await asyncio.sleep(self.delay)
+        return {"written": data}, 200
+
+
+def test_without_a_window_every_edit_is_written():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=0)
+        write = Recorder()
+        results = await asyncio.gather(queue.submit(1, "a", write), queue.submit(1, "b", write))
+        return write.writes, results
+
+    writes, results = run(scenario())
+    assert writes == ["a", "b"]
+    assert results == [({"written": "a"}, 200), ({"written": "b"}, 200)]
+
+
+def test_last_writer_wins_and_every_caller_gets_the_result():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=0.05)
+        write = Recorder()
+        results = await asyncio.gather(*(queue.submit(1, edit, write) for edit in ("a", "b", "c")))
+        return write.writes, results
+
+    writes, results = run(scenario())
+    assert writes == ["c"]
+    assert results == [({"written": "c"}, 200)] * 3
+
+
+def test_keys_are_written_separately():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=0.05)
+        write = Recorder()
+        await asyncio.gather(queue.submit(1, "one", write), queue.submit(2, "two", write))
+        return sorted(write.writes)
+
+    assert run(scenario()) == ["one", "two"]
+
+
+def test_batches_for_a_key_are_written_in_order():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=0.01)
+        write = Recorder(delay=0.05)
+        first = asyncio.create_task(queue.submit(1, "first", write))
+        # Opens the next batch while the first one is still being written.
+        await asyncio.sleep(0.02)
+        second = asyncio.create_task(queue.submit(1, "second", write))
+        await asyncio.sleep(0.02)
+        in_flight = list(write.writes)
+        await asyncio.gather(first, second)
+        return in_flight, write.writes
+
+    in_flight, writes = run(scenario())
+    assert in_flight == ["first"]
+    assert writes == ["first", "second"]
+
+
+def test_drain_flushes_open_batches_without_waiting_for_the_window():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=60)
+        write = Recorder()
+        pending = asyncio.create_task(queue.submit(1, "edit", write))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(queue.drain(), timeout=1)
+        return write.writes, await pending
+
+    writes, result = run(scenario())
+    assert writes == ["edit"]
+    assert result == ({"written": "edit"}, 200)
+
+
+def test_edit_during_drain_joins_the_open_batch():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=60)
+        write = Recorder()
+        pending = asyncio.create_task(queue.submit(1, "queued", write))
+        await asyncio.sleep(0)
+        drain = asyncio.create_task(queue.drain())
+        await asyncio.sleep(0)
+        late = await asyncio.wait_for(queue.submit(1, "late", write), timeout=1)
+        await drain
+        return write.writes, await pending, late
+
+    writes, queued, late = run(scenario())
+    # The older edit must not be written after, and over, the newer one.
+    assert writes == ["late"]
+    assert queued == late == ({"written": "late"}, 200)
+
+
+def test_edit_during_drain_waits_for_the_batch_being_written():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=60)
+        write = Recorder(delay=0.05)
+        pending = asyncio.create_task(queue.submit(1, "queued", write))
+        await asyncio.sleep(0)
+        drain = asyncio.create_task(queue.drain())
+        await asyncio.sleep(0.01)
+        late = await asyncio.wait_for(queue.submit(1, "late", write), timeout=1)
+        await drain
+        return write.writes, await pending, late
+
+    writes, queued, late = run(scenario())
+    assert writes == ["queued", "late"]
+    assert queued == ({"written": "queued"}, 200)
+    assert late == ({"written": "late"}, 200)
+
+
+def test_write_errors_reach_every_caller():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=0.01)
+
+        async def write(data):
+            raise RuntimeError("upstream down")
+
+        return await asyncio.gather(
+            queue.submit(1, "a", write), queue.submit(1, "b", write), return_exceptions=True
+        )
+
+    results = run(scenario())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert all(str(result) == "upstream down" for result in results)
+
+
+def test_cancelled_caller_does_not_cancel_the_write():
+    async def scenario():
+        queue = WriteCoalescingQueue("test", window=0.02)
+        write = Recorder()
+        leaving = asyncio.create_task(queue.submit(1, "a", write))
+        staying = asyncio.create_task(queue.submit(1, "b", write))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leaving
+        return write.writes, await staying
+
+    writes, result = run(scenario())
+    assert writes == ["b"]
+    assert result == ({"written": "b"}, 200)
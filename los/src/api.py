@@ -1,86 +1,204 @@
 import asyncio
-import time
-from fastapi import APIRouter, HTTPException
-from pydantic import create_model
+import json
+from typing import Any, List
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from .cache import TTLCache
+from .circuit_breaker import circuit_breakers
+from .catalogue import ServiceTypeCatalogue, validate_services
 from .client import make_request_with_retry
 from .auth import get_access_token
-from .config import API_BASE_URL, SCHEMA_CACHE_TTL, SERVICE_TYPE_CACHE_TTL
+from .jobs import JobQueue, failure_outcome
+from .retry import IDEMPOTENCY_KEY_HEADER
+from .validation import get_request_validator
+from .config import (
+    API_BASE_URL,
+    SCHEMA_CACHE_TTL,
+    SERVICE_TYPE_CACHE_TTL,
+    CACHE_TTL_JITTER,
+    CACHE_FAILURE_BACKOFF,
+    CACHE_MAX_FAILURE_BACKOFF,
+    SERVICE_REQUEST_BULK_MAX_ITEMS,
+    SERVICE_REQUEST_BULK_CONCURRENCY,
+)
 
 router = APIRouter()
 
 # Caching state
-schema_cache = {"data": None, "expires_at": 0}
-service_type_cache = {"data": None, "expires_at": 0}
-schema_lock = asyncio.Lock()
-service_type_lock = asyncio.Lock()
+schema_cache = TTLCache(
+    "schema_cache",
+    SCHEMA_CACHE_TTL,
+    jitter=CACHE_TTL_JITTER,
+    failure_backoff=CACHE_FAILURE_BACKOFF,
+    max_failure_backoff=CACHE_MAX_FAILURE_BACKOFF,
+)
+service_type_cache = TTLCache(
+    "service_type_cache",
+    SERVICE_TYPE_CACHE_TTL,
+    jitter=CACHE_TTL_JITTER,
+    failure_backoff=CACHE_FAILURE_BACKOFF,
+    max_failure_backoff=CACHE_MAX_FAILURE_BACKOFF,
+)
 
 # ================== SCHEMA RETRIEVAL ==================
+async def fetch_service_request_schema():
+    token = await get_access_token()
+    url = f"{API_BASE_URL}/serviceRequest/fields"
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await make_request_with_retry(url, headers)
+
+    schema = response.json().get("data", {}).get("model", {}).get("jsonSchema", {})
+    if not schema:
+        raise HTTPException(status_code=500, detail="Failed to retrieve schema")
+    return schema
+
 @router.get("/service-request/schema")
 async def get_service_request_schema():
-    async with schema_lock:
-        if schema_cache["data"] and time.time() < schema_cache["expires_at"]:
-            return schema_cache["data"]
-
-        token = await get_access_token()
-        url = f"{API_BASE_URL}/serviceRequest/fields"
-        headers = {"Authorization": f"Bearer {token}"}
-        response = await make_request_with_retry(url, headers)
+    return await schema_cache.get(fetch_service_request_schema)
 
-        schema = response.json().get("data", {}).get("model", {}).get("jsonSchema", {})
-        if not schema:
-            raise HTTPException(status_code=500, detail="Failed to retrieve schema")
+# ================== SERVICE TYPES RETRIEVAL ==================
+async def fetch_service_types():
+    token = await get_access_token()
+    url = f"{API_BASE_URL}/utility/serviceTypes"
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await make_request_with_retry(url, headers)
 
-        schema_cache["data"] = schema
-        schema_cache["expires_at"] = time.time() + SCHEMA_CACHE_TTL
-        return schema
+    service_types = response.json().get("data", [])
+    if not service_types:
+        raise HTTPException(status_code=500, detail="Failed to retrieve service types")
+    return ServiceTypeCatalogue(service_types)
 
-# ================== SERVICE TYPES RETRIEVAL ==================
-@router.get("/service-types")
 async def get_service_types():
-    async with service_type_lock:
-        if service_type_cache["data"] and time.time() < service_type_cache["expires_at"]:
-            return service_type_cache["data"]
+    """Returns the cached ServiceTypeCatalogue."""
+    return await service_type_cache.get(fetch_service_types)
 
-        token = await get_access_token()
-        url = f"{API_BASE_URL}/utility/serviceTypes"
-        headers = {"Authorization": f"Bearer {token}"}
-        response = await make_request_with_retry(url, headers)
+@router.get("/service-types")
+async def read_service_types():
+    catalogue = await get_service_types()
+    return list(catalogue.names)
 
-        service_types = response.json().get("data", [])
-        if not service_types:
-            raise HTTPException(status_code=500, detail="Failed to retrieve service types")
+@router.get("/cache-stats")
+async def get_cache_stats():
+    return {cache.name: {**cache.stats, "version": cache.version} for cache in (schema_cache, service_type_cache)}
 
-        service_type_cache["data"] = [st.get("serviceType") for st in service_types]
-        service_type_cache["expires_at"] = time.time() + SERVICE_TYPE_CACHE_TTL
-        return service_type_cache["data"]
+@router.get("/circuit-breakers")
+async def get_circuit_breakers():
+    return circuit_breakers.snapshot()
 
 # ================== SERVICE REQUEST CREATION ==================
-@router.post("/service-request")
-async def create_service_request(request_body: dict):
+async def submit_service_request(request_body, idempotency_key=None):
+    """Validates a service request and POSTs it upstream. Returns the created request's data."""
     schema = await get_service_request_schema()
     service_types = await get_service_types()
 
-    # Generate dynamic models
-    CollateralModel = create_model("CollateralModel", **{
-        "serviceType": (str, ...),
-        "value": (float, None)
-    })
-
-    try:
-        for collateral in request_body["data"]["collaterals"]:
-            for service in collateral["services"]:
-                if service["serviceType"] not in service_types:
-                    raise ValueError(f"Invalid service type: {service['serviceType']}")
-            CollateralModel(**collateral)
-    except Exception as e:
-        raise HTTPException(status_code=422, detail=str(e))
+    # Compiled once per schema version, see validation.get_request_validator
+    validate_request = get_request_validator(schema)
 
+    errors = validate_request(request_body)
+    errors.extend(validate_services(request_body, service_types))
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    return await post_service_request(request_body, idempotency_key)
+
+async def post_service_request(request_body, idempotency_key=None):
+    """POSTs an already validated service request upstream. Returns the created request's data."""
     token = await get_access_token()
     url = f"{API_BASE_URL}/serviceRequest/form"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    if idempotency_key:
+        headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
     response = await make_request_with_retry(url, headers, method="POST", data=request_body)
 
     if response.status_code == 201:
         return response.json()["data"]
     else:
-        raise HTTPException(status_code=response.status_code, detail=response.json())
\ No newline at end of file
+        raise HTTPException(status_code=response.status_code, detail=response.json())
+
+# Jobs use their id as idempotency key, so a job resumed after a restart is not created twice.
+job_queue = JobQueue(submit_service_request)
+
+@router.post("/service-request")
+async def create_service_request(request_body: dict, request: Request, async_: bool = Query(False, alias="async")):
+    if not async_:
+        return await submit_service_request(request_body)
+
+    # Validation and submission happen in a worker; poll the job for the outcome.
+    job_id = job_queue.submit(request_body)
+    location = str(request.url_for("get_service_request_job", job_id=job_id))
+    return JSONResponse(
+        status_code=202,
+        content={"jobId": job_id, "status": "queued", "statusUrl": location},
+        headers={"Location": location},
+    )
+
+@router.get("/service-request/jobs/{job_id}")
+async def get_service_request_job(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+# ================== BULK SERVICE REQUEST CREATION ==================
+def validate_service_requests(request_bodies, validate_request, service_types):
+    """
+    Validates a batch of service requests with one compiled schema validator and the
+    service type catalogue. Returns one error list per item, empty for valid items.
+    """
+    errors = []
+    for request_body in request_bodies:
+        item_errors = validate_request(request_body)
+        item_errors.extend(validate_services(request_body, service_types))
+        errors.append(item_errors)
+    return errors
+
+async def submit_bulk_item(index, request_body, semaphore):
+    async with semaphore:
+        try:
+            data = await post_service_request(request_body)
+        except Exception as e:
+            status_code, detail = failure_outcome(e)
+            return {"index": index, "status": status_code, "detail": detail}
+    return {"index": index, "status": 201, "data": data}
+
+@router.post("/service-request/bulk")
+async def create_service_requests_bulk(request_bodies: List[Any], stream: bool = Query(False)):
+    """
+    Creates many service requests. The batch is validated up front against the cached
+    schema and service types; valid items are then POSTed upstream with bounded
+    concurrency. Returns one {"index", "status", "data" | "detail"} result per item, in
+    request order, or with `stream` as NDJSON lines in completion order.
+    """
+    if len(request_bodies) > SERVICE_REQUEST_BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {SERVICE_REQUEST_BULK_MAX_ITEMS} service requests per batch")
+
+    schema = await get_service_request_schema()
+    service_types = await get_service_types()
+    errors = validate_service_requests(request_bodies, get_request_validator(schema), service_types)
+
+    invalid = [
+        {"index": index, "status": 422, "detail": item_errors}
+        for index, item_errors in enumerate(errors) if item_errors
+    ]
+    semaphore = asyncio.Semaphore(SERVICE_REQUEST_BULK_CONCURRENCY)
+    tasks = [
+        asyncio.create_task(submit_bulk_item(index, request_body, semaphore))
+        for index, request_body in enumerate(request_bodies) if not errors[index]
+    ]
+
+    if not stream:
+        results = invalid + list(await asyncio.gather(*tasks))
+        return sorted(results, key=lambda result: result["index"])
+
+    async def stream_results():
+        try:
+            for result in invalid:
+                yield json.dumps(jsonable_encoder(result)) + "\n"
+            for task in asyncio.as_completed(tasks):
+                yield json.dumps(jsonable_encoder(await task)) + "\n"
+        finally:
+            # The client went away: submissions not yet sent are dropped.
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
@@ -1,27 +1,63 @@
-import httpx
 import logging
-from .config import TOKEN_URL, CLIENT_ID, CLIENT_SECRET, PROXY, VERIFY_SSL
+import time
+import httpx
+from .config import TOKEN_URL, CLIENT_ID, CLIENT_SECRET, SCOPE, TOKEN_REFRESH_MARGIN
+from .circuit_breaker import circuit_breakers
+from .deadline import request_timeout, wait_within_deadline
+from .http_client import get_http_client
+from .metrics import TOKEN_REFRESHES, endpoint_label, track_upstream
+from .rate_limiter import parse_retry_after, rate_limiter
+from .token_manager import TokenManager
 
 logger = logging.getLogger(__name__)
 
-access_token = None
+
+async def request_access_token(client_id, scope=None):
+    data = {
+        "grant_type": "client_credentials",
+        "client_id": client_id,
+        "client_secret": CLIENT_SECRET
+    }
+    if scope:
+        data["scope"] = scope
+
+    # Token fetches count against the same upstream budget as API calls.
+    await wait_within_deadline(rate_limiter.acquire())
+    timeout = request_timeout()
+    breaker = circuit_breakers.get("oauth")
+    breaker.check()
+    started = time.monotonic()
+    try:
+        with track_upstream(endpoint_label(httpx.URL(TOKEN_URL).path), "POST") as call:
+            response = await get_http_client().post(
+                TOKEN_URL,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=timeout,
+            )
+            call["status"] = response.status_code
+    except httpx.RequestError:
+        breaker.record(False, time.monotonic() - started)
+        TOKEN_REFRESHES.labels(result="failure").inc()
+        raise
+    breaker.record(response.status_code < 500, time.monotonic() - started)
+    TOKEN_REFRESHES.labels(result="success" if response.is_success else "failure").inc()
+    if response.status_code == 429:
+        await rate_limiter.on_rate_limited(parse_retry_after(response.headers.get("Retry-After")))
+    elif response.is_success:
+        await rate_limiter.on_success(response.headers)
+    response.raise_for_status()
+    token_data = response.json()
+    logger.info("Access token obtained successfully")
+    return token_data.get("access_token"), token_data.get("expires_in")
+
+
+token_manager = TokenManager(request_access_token, refresh_margin=TOKEN_REFRESH_MARGIN)
+
 
 async def get_access_token():
-    global access_token
-    if access_token:
-        return access_token
-    
-    async with httpx.AsyncClient(proxies=PROXY, verify=VERIFY_SSL) as client:
-        response = await client.post(
-            TOKEN_URL,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": CLIENT_ID,
-                "client_secret": CLIENT_SECRET
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
-        response.raise_for_status()
-        access_token = response.json().get("access_token")
-        logger.info("Access token obtained successfully")
-        return access_token
\ No newline at end of file
+    return await token_manager.get_token(CLIENT_ID, SCOPE)
+
+
+def invalidate_access_token():
+    token_manager.invalidate(CLIENT_ID, SCOPE)
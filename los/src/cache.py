@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import random
+import time
+from .deadline import create_background_task
+from .metrics import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Single-value async cache with stale-while-revalidate semantics.
+
+    Only the very first load (or a load after `clear()`) makes callers wait. Once a
+    value exists it is always served immediately: when it is past its TTL, one
+    background task refreshes it, and if that refresh fails the stale value keeps
+    being served while further attempts back off exponentially.
+    """
+
+    def __init__(self, name, ttl, jitter=0.1, failure_backoff=30, max_failure_backoff=300):
+        self.name = name
+        self.ttl = ttl
+        self.jitter = jitter
+        self.failure_backoff = failure_backoff
+        self.max_failure_backoff = max_failure_backoff
+        self.data = None
+        self.expires_at = 0
+        self.version = 0
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0}
+        self._lock = asyncio.Lock()
+        self._refresh_task = None
+        self._failures = 0
+        self._retry_at = 0
+
+    async def get(self, loader):
+        """Returns the cached value, calling the `loader` coroutine function only as described above."""
+        if self.data is not None:
+            now = time.time()
+            if now < self.expires_at:
+                self.stats["hits"] += 1
+                CACHE_REQUESTS.labels(cache=self.name, result="hit").inc()
+            else:
+                self.stats["stale_hits"] += 1
+                CACHE_REQUESTS.labels(cache=self.name, result="stale_hit").inc()
+                if now >= self._retry_at:
+                    self._refresh_in_background(loader)
+            return self.data
+
+        self.stats["misses"] += 1
+        CACHE_REQUESTS.labels(cache=self.name, result="miss").inc()
+        async with self._lock:
+            if self.data is not None:
+                return self.data
+            return await self._load(loader)
+
+    def clear(self):
+        self.data = None
+        self.expires_at = 0
+
+    async def _load(self, loader):
+        try:
+            data = await loader()
+        except Exception:
+            self._failures += 1
+            self.stats["refresh_failures"] += 1
+            backoff = min(self.failure_backoff * 2 ** (self._failures - 1), self.max_failure_backoff)
+            self._retry_at = time.time() + backoff
+            raise
+
+        self.data = data
+        self.version += 1
+        self.expires_at = time.time() + self.ttl * random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.stats["refreshes"] += 1
+        self._failures = 0
+        self._retry_at = 0
+        return data
+
+    def _refresh_in_background(self, loader):
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        self._refresh_task = create_background_task(self._background_refresh(loader))
+
+    async def _background_refresh(self, loader):
+        async with self._lock:
+            if time.time() < self.expires_at:
+                return
+            try:
+                await self._load(loader)
+            except Exception as e:
+                logger.warning(f"Refreshing {self.name} failed, serving stale data: {e}")
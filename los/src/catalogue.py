@@ -0,0 +1,81 @@
+from .validation import json_pointer
+
+
+class ServiceTypeCatalogue:
+    """
+    Indexed view of the upstream `/utility/serviceTypes` payload.
+
+    `types` is a frozenset for O(1) membership checks and `by_type` maps each
+    serviceType to its display name and feature IDs.
+    """
+
+    __slots__ = ("names", "types", "by_type")
+
+    def __init__(self, service_types):
+        self.by_type = {}
+        for st in service_types:
+            service_type = st.get("serviceType")
+            if service_type is None:
+                continue
+            self.by_type[service_type] = {
+                "displayName": st.get("displayName"),
+                "featureIDs": frozenset(_feature_ids(st)),
+            }
+        self.names = tuple(self.by_type)
+        self.types = frozenset(self.by_type)
+
+    def __contains__(self, service_type):
+        return service_type in self.types
+
+    def __len__(self):
+        return len(self.types)
+
+
+def _feature_ids(service_type):
+    if "featureIDs" in service_type:
+        return service_type["featureIDs"] or []
+    if "features" in service_type:
+        return [f.get("featureID") for f in service_type["features"] if f.get("featureID") is not None]
+    if service_type.get("featureID") is not None:
+        return [service_type["featureID"]]
+    return []
+
+
+def validate_services(request_body, catalogue):
+    """
+    Checks every service of every collateral against the catalogue in a single pass.
+    Returns errors in the same shape as validation.SchemaValidator's; empty when valid.
+    """
+    errors = []
+    data = request_body.get("data") if isinstance(request_body, dict) else None
+    collaterals = data.get("collaterals") if isinstance(data, dict) else None
+    if not isinstance(collaterals, list):
+        return errors
+
+    for i, collateral in enumerate(collaterals):
+        services = collateral.get("services") if isinstance(collateral, dict) else None
+        if not isinstance(services, list):
+            continue
+        for j, service in enumerate(services):
+            if not isinstance(service, dict):
+                continue
+            loc = ["data", "collaterals", i, "services", j]
+            service_type = service.get("serviceType")
+            entry = catalogue.by_type.get(service_type)
+            if entry is None:
+                errors.append({
+                    "loc": loc + ["serviceType"],
+                    "pointer": json_pointer(loc + ["serviceType"]),
+                    "msg": f"Invalid service type: {service_type}",
+                    "type": "value_error.service_type",
+                })
+                continue
+            feature_id = service.get("featureID")
+            if feature_id is not None and entry["featureIDs"] and feature_id not in entry["featureIDs"]:
+                errors.append({
+                    "loc": loc + ["featureID"],
+                    "pointer": json_pointer(loc + ["featureID"]),
+                    "msg": f"Feature {feature_id} is not offered for service type {service_type}",
+                    "type": "value_error.feature_id",
+                })
+    return errors
@@ -0,0 +1,170 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+from .config import (
+    API_BASE_URL,
+    TOKEN_URL,
+    CIRCUIT_FAILURE_RATE_THRESHOLD,
+    CIRCUIT_SLOW_CALL_SECONDS,
+    CIRCUIT_SLOW_CALL_RATE_THRESHOLD,
+    CIRCUIT_WINDOW_SIZE,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_HALF_OPEN_CALLS,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Upstream path prefix -> endpoint group
+ENDPOINT_GROUPS = {
+    "/oauth": "oauth",
+    "/collateralOverview": "collateralOverview",
+    "/serviceRequest": "serviceRequest",
+    "/utility": "utility",
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream endpoint group whose circuit is open."""
+
+    def __init__(self, breaker):
+        super().__init__(f"Upstream '{breaker.name}' is temporarily unavailable")
+        self.breaker = breaker
+        self.retry_after = breaker.retry_after()
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of the last `window_size` calls to one endpoint group.
+
+    Opens when the failure rate or the slow-call rate crosses its threshold, so
+    callers fail fast instead of waiting on timeouts. After `open_seconds` it lets
+    `half_open_calls` probes through: if they succeed it closes, otherwise it opens again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = CIRCUIT_FAILURE_RATE_THRESHOLD,
+        slow_call_seconds: float = CIRCUIT_SLOW_CALL_SECONDS,
+        slow_call_rate_threshold: float = CIRCUIT_SLOW_CALL_RATE_THRESHOLD,
+        window_size: int = CIRCUIT_WINDOW_SIZE,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+        half_open_calls: int = CIRCUIT_HALF_OPEN_CALLS,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._calls = deque(maxlen=window_size)  # (failed, slow)
+        self._probes_in_flight = 0
+        self._probe_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        """Raises CircuitOpenError while calls to this group should fail fast."""
+        if not self.allow_request():
+            raise CircuitOpenError(self)
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.open_seconds:
+                    self.rejected += 1
+                    return False
+                self.state = HALF_OPEN
+                self._probes_in_flight = 0
+            if self.state == HALF_OPEN:
+                now = time.monotonic()
+                # A probe that never reported back (e.g. cancelled) must not wedge the circuit.
+                if self._probes_in_flight >= self.half_open_calls and now - self._probe_started_at < self.open_seconds:
+                    self.rejected += 1
+                    return False
+                if self._probes_in_flight >= self.half_open_calls:
+                    self._probes_in_flight = 0
+                self._probes_in_flight += 1
+                self._probe_started_at = now
+            return True
+
+    def record(self, success: bool, elapsed: float) -> None:
+        slow = elapsed >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                if success and not slow:
+                    self._close()
+                else:
+                    self._open()
+                return
+            self._calls.append((not success, slow))
+            if len(self._calls) >= self.min_calls:
+                failure_rate = sum(failed for failed, _ in self._calls) / len(self._calls)
+                slow_rate = sum(slow for _, slow in self._calls) / len(self._calls)
+                if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                    self._open()
+
+    def retry_after(self) -> int:
+        """Seconds until the next probe is allowed, for the Retry-After header."""
+        return max(int(self.open_seconds - (time.monotonic() - self.opened_at)) + 1, 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = len(self._calls)
+            return {
+                "state": self.state,
+                "calls": calls,
+                "failure_rate": sum(failed for failed, _ in self._calls) / calls if calls else 0.0,
+                "slow_call_rate": sum(slow for _, slow in self._calls) / calls if calls else 0.0,
+                "rejected": self.rejected,
+            }
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self._calls.clear()
+
+    def _close(self):
+        self.state = CLOSED
+        self._calls.clear()
+
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per upstream endpoint group."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, group: str) -> CircuitBreaker:
+        breaker = self._breakers.get(group)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(group, CircuitBreaker(group))
+        return breaker
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        if url == TOKEN_URL:
+            return self.get("oauth")
+        return self.for_endpoint(url[len(API_BASE_URL):] if url.startswith(API_BASE_URL) else url)
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        for prefix, group in ENDPOINT_GROUPS.items():
+            if endpoint.startswith(prefix):
+                return self.get(group)
+        return self.get("default")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in list(self._breakers.items())}
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -1,43 +1,71 @@
-import asyncio
+import time
 import httpx
 import logging
-from .auth import get_access_token
-from .config import PROXY, VERIFY_SSL, BASE_DELAY, MAX_RETRIES
+from .auth import get_access_token, invalidate_access_token
+from .circuit_breaker import circuit_breakers
+from .deadline import request_timeout, sleep_within_deadline, wait_within_deadline
+from .http_client import get_http_client
+from .metrics import UPSTREAM_RETRIES, endpoint_label, track_upstream
+from .rate_limiter import rate_limiter, parse_retry_after
+from .retry import retry_policy
 
 logger = logging.getLogger(__name__)
 
 async def make_request_with_retry(url, headers, method="GET", data=None):
-    retries = 0
+    retry_policy.prepare_headers(method, headers)
+    retry_policy.budget.record_request()
+    breaker = circuit_breakers.for_url(url)
+    endpoint = endpoint_label(httpx.URL(url).path)
+    attempt = 0
 
-    while retries < MAX_RETRIES:
+    while True:
         try:
-            async with httpx.AsyncClient(proxies=PROXY, verify=VERIFY_SSL) as client:
-                if method == "GET":
-                    response = await client.get(url, headers=headers)
-                elif method == "POST":
-                    response = await client.post(url, json=data, headers=headers)
-                
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        wait_time = int(retry_after)
-                    else:
-                        wait_time = BASE_DELAY * (2 ** retries) + (0.1 * retries)
-                    logger.warning(f"Rate limit reached. Retrying in {wait_time:.2f} seconds...")
-                    await asyncio.sleep(wait_time)
-                elif response.status_code == 401 and retries == 0:
-                    logger.warning("Token expired. Refreshing token and retrying...")
-                    headers["Authorization"] = f"Bearer {await get_access_token()}"
-                else:
-                    response.raise_for_status()
-                    return response
-
+            client = get_http_client()
+            await wait_within_deadline(rate_limiter.acquire())
+            timeout = request_timeout()
+            breaker.check()
+            started = time.monotonic()
+            with track_upstream(endpoint, method) as call:
+                response = await client.request(method, url, json=data, headers=headers, timeout=timeout)
+                call["status"] = response.status_code
+            breaker.record(response.status_code < 500, time.monotonic() - started)
         except httpx.RequestError as e:
-            logger.warning(f"Request failed: {e}. Retrying...")
-            wait_time = BASE_DELAY * (2 ** retries) + (0.1 * retries)
-            await asyncio.sleep(wait_time)
+            breaker.record(False, time.monotonic() - started)
+            if not retry_policy.should_retry(attempt, method, headers, error=e):
+                logger.error(f"Request failed: {e}. Not retrying.")
+                raise
+            wait_time = retry_policy.backoff(attempt)
+            logger.warning(f"Request failed: {e}. Retrying in {wait_time:.2f} seconds...")
+            UPSTREAM_RETRIES.labels(endpoint=endpoint, reason="error").inc()
+            await sleep_within_deadline(wait_time)
+            attempt += 1
+            continue
 
-        retries += 1
+        if response.status_code == 401 and attempt == 0:
+            logger.warning("Token expired. Refreshing token and retrying...")
+            invalidate_access_token()
+            UPSTREAM_RETRIES.labels(endpoint=endpoint, reason="401").inc()
+            headers["Authorization"] = f"Bearer {await get_access_token()}"
+        elif response.status_code == 429:
+            if not retry_policy.should_retry(attempt, method, headers, response=response):
+                logger.error("Rate limit reached and retries exhausted. Failing request.")
+                response.raise_for_status()
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                retry_after = retry_policy.backoff(attempt)
+            # Pauses every caller sharing the limiter; the next acquire() waits it out.
+            wait_time = await rate_limiter.on_rate_limited(retry_after)
+            logger.warning(f"Rate limit reached. Retrying in {wait_time:.2f} seconds...")
+            UPSTREAM_RETRIES.labels(endpoint=endpoint, reason="429").inc()
+        elif retry_policy.should_retry(attempt, method, headers, response=response):
+            wait_time = retry_policy.backoff(attempt)
+            logger.warning(f"Upstream returned {response.status_code}. Retrying in {wait_time:.2f} seconds...")
+            UPSTREAM_RETRIES.labels(endpoint=endpoint, reason=str(response.status_code)).inc()
+            await sleep_within_deadline(wait_time)
+        else:
+            if response.status_code < 400:
+                await rate_limiter.on_success(response.headers)
+            response.raise_for_status()
+            return response
 
-    logger.error("Max retries reached. Failing request.")
-    raise httpx.HTTPStatusError("Max retries reached", request=None, response=None)
\ No newline at end of file
+        attempt += 1
@@ -2,11 +2,69 @@ API_BASE_URL = "https://api.xyz.corp.lightboxre.com/v1/los"
 TOKEN_URL = f"{API_BASE_URL}/oauth/token"
 CLIENT_ID = "your_client_id"
 CLIENT_SECRET = "your_client_secret"
+SCOPE = None
 PROXY = "http://your-proxy-url:8080"
 VERIFY_SSL = False
-MAX_RETRIES = 3
+
+# Shared upstream connection pool (HTTP/2 requires the httpx[http2] extra; without it HTTP/1.1 is used)
+HTTP2 = True
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 30  # seconds an idle connection is kept open
+
+# Adaptive client-side rate limit for the LOS API (requests per second)
+RATE_LIMIT_MIN_RATE = 1
+RATE_LIMIT_MAX_RATE = 100
+RATE_LIMIT_INITIAL_RATE = RATE_LIMIT_MAX_RATE  # unthrottled until a 429 or rate-limit header says otherwise
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_INCREASE = 0.5  # rate added per second of successful traffic
+RATE_LIMIT_DECREASE_FACTOR = 0.5  # rate multiplier applied on every 429
+RATE_LIMIT_STATE_PATH = None  # e.g. "/dev/shm/los_rate_limit.json" to share the bucket across workers
+
+MAX_RETRIES = 3  # attempts per call, including the first
 BASE_DELAY = 1  # Start with 1 second delay
+RETRY_MAX_DELAY = 30
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+RETRY_BUDGET_RATIO = 0.2  # retries allowed per request on average
+RETRY_BUDGET_MIN_PER_SECOND = 1
+RETRY_BUDGET_MAX_TOKENS = 100
+UPSTREAM_HONORS_IDEMPOTENCY_KEYS = False  # allow retrying POST/PATCH on 5xx/timeouts when True
+TOKEN_REFRESH_MARGIN = 60  # Refresh tokens this many seconds before they expire
+
+# Timeouts. Each incoming request gets one total budget that token fetches,
+# upstream calls, retries and backoff sleeps all draw from.
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 15
+REQUEST_TIMEOUT_BUDGET = 30
+ROUTE_TIMEOUT_BUDGETS = {  # incoming path prefix -> budget, longest prefix wins
+    "/wrapper/service-request": 45,
+    "/wrapper/service-request/bulk": 600,
+}
+
+# Circuit breakers per upstream endpoint group (oauth, collateralOverview, serviceRequest, utility)
+CIRCUIT_FAILURE_RATE_THRESHOLD = 0.5  # open when half of the recent calls failed
+CIRCUIT_SLOW_CALL_SECONDS = 10
+CIRCUIT_SLOW_CALL_RATE_THRESHOLD = 0.8  # ...or when most recent calls were slow
+CIRCUIT_WINDOW_SIZE = 20  # recent calls considered
+CIRCUIT_MIN_CALLS = 10  # calls needed before the rates are trusted
+CIRCUIT_OPEN_SECONDS = 30  # fail fast this long before probing again
+CIRCUIT_HALF_OPEN_CALLS = 1
 
 # Cache TTL (in seconds)
 SCHEMA_CACHE_TTL = 900  # 15 minutes
-SERVICE_TYPE_CACHE_TTL = 900  # 15 minutes
\ No newline at end of file
+SERVICE_TYPE_CACHE_TTL = 900  # 15 minutes
+CACHE_TTL_JITTER = 0.1  # TTLs vary by +/-10% so workers don't all refresh at once
+CACHE_FAILURE_BACKOFF = 30  # first retry delay after a failed refresh, doubled per failure
+CACHE_MAX_FAILURE_BACKOFF = 300
+
+# Asynchronous service request submission (POST /service-request?async=true)
+SERVICE_REQUEST_JOB_WORKERS = 4  # submissions processed concurrently
+SERVICE_REQUEST_JOB_QUEUE_SIZE = 1000  # queued submissions before new ones get a 503
+SERVICE_REQUEST_JOB_BUDGET = 300  # seconds one submission may take, retries included
+SERVICE_REQUEST_JOB_DB_PATH = "service_request_jobs.sqlite3"
+SERVICE_REQUEST_JOB_RETENTION = 7 * 24 * 3600  # finished jobs are deleted after this many seconds
+SERVICE_REQUEST_JOB_STOP_GRACE = 30  # seconds running submissions get to finish on shutdown
+
+# Bulk service request submission (POST /service-request/bulk)
+SERVICE_REQUEST_BULK_MAX_ITEMS = 1000
+SERVICE_REQUEST_BULK_CONCURRENCY = 8  # upstream POSTs in flight per bulk request
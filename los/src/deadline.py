@@ -0,0 +1,81 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+import httpx
+from .config import CONNECT_TIMEOUT, READ_TIMEOUT, REQUEST_TIMEOUT_BUDGET, ROUTE_TIMEOUT_BUDGETS
+
+_deadline = ContextVar("upstream_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the incoming request's time budget cannot cover the next upstream step."""
+
+
+def budget_for_path(path):
+    matches = [prefix for prefix in ROUTE_TIMEOUT_BUDGETS if path.startswith(prefix)]
+    if not matches:
+        return REQUEST_TIMEOUT_BUDGET
+    return ROUTE_TIMEOUT_BUDGETS[max(matches, key=len)]
+
+
+@contextmanager
+def request_deadline(budget):
+    """Sets the deadline for everything awaited inside the block. Nested deadlines can only shrink it."""
+    deadline = time.monotonic() + budget
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def create_background_task(coro):
+    """
+    Starts `coro` as a task outside the current request's deadline. asyncio.create_task
+    copies the caller's context, so work that outlives the request (cache and token
+    refreshes) would otherwise inherit, and die by, whatever is left of its budget.
+    """
+    context = copy_context()
+    context.run(_deadline.set, None)
+    return context.run(asyncio.create_task, coro)
+
+
+def remaining_budget():
+    """Seconds left before the current request's deadline, or None outside a request."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def request_timeout():
+    """httpx timeouts for the next upstream call, capped by the remaining budget."""
+    remaining = remaining_budget()
+    if remaining is None:
+        return httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded before calling upstream")
+    return httpx.Timeout(min(READ_TIMEOUT, remaining), connect=min(CONNECT_TIMEOUT, remaining))
+
+
+async def sleep_within_deadline(delay):
+    """Backoff sleep that fails fast instead of sleeping past the deadline."""
+    remaining = remaining_budget()
+    if remaining is not None and delay >= remaining:
+        raise DeadlineExceeded(f"Retrying in {delay:.2f}s would exceed the request deadline")
+    await asyncio.sleep(delay)
+
+
+async def wait_within_deadline(awaitable):
+    """Awaits `awaitable`, giving up when the request's deadline passes."""
+    remaining = remaining_budget()
+    if remaining is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(remaining, 0))
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("Request deadline exceeded while waiting") from None
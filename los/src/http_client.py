@@ -0,0 +1,63 @@
+import httpx
+import logging
+
+try:
+    import h2  # Provided by the httpx[http2] extra.
+except ImportError:  # Without it httpx refuses http2=True; fall back to HTTP/1.1.
+    h2 = None
+
+from .config import (
+    PROXY,
+    VERIFY_SSL,
+    HTTP2,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def _build_client():
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+    http2 = HTTP2 and h2 is not None
+    if HTTP2 and not http2:
+        logger.warning("HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+    return httpx.AsyncClient(proxies=PROXY, verify=VERIFY_SSL, http2=http2, limits=limits, timeout=timeout)
+
+
+async def open_http_client():
+    """Opens the application-wide client. Called from the FastAPI lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        logger.info("Upstream HTTP client opened")
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Upstream HTTP client closed")
+
+
+def get_http_client():
+    """
+    Returns the shared client so connections are reused across calls and retries.
+    Falls back to creating it lazily when used outside the app lifespan (scripts, shells).
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
@@ -0,0 +1,240 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+import httpx
+from fastapi import HTTPException
+from .circuit_breaker import CircuitOpenError
+from .deadline import DeadlineExceeded, request_deadline
+from .metrics import JOBS_FINISHED, JOBS_QUEUED
+from .config import (
+    SERVICE_REQUEST_JOB_WORKERS,
+    SERVICE_REQUEST_JOB_QUEUE_SIZE,
+    SERVICE_REQUEST_JOB_BUDGET,
+    SERVICE_REQUEST_JOB_DB_PATH,
+    SERVICE_REQUEST_JOB_RETENTION,
+    SERVICE_REQUEST_JOB_STOP_GRACE,
+    UPSTREAM_HONORS_IDEMPOTENCY_KEYS,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+PURGE_INTERVAL = 3600
+
+
+def failure_outcome(error):
+    """(status_code, detail) reported for a service request submission that raised `error`."""
+    if isinstance(error, HTTPException):
+        return error.status_code, error.detail
+    if isinstance(error, CircuitOpenError):
+        return 503, str(error)
+    if isinstance(error, DeadlineExceeded):
+        return 504, str(error)
+    if isinstance(error, httpx.HTTPStatusError):
+        # The upstream answered with an error status; report it and its body unchanged.
+        try:
+            return error.response.status_code, error.response.json()
+        except ValueError:
+            return error.response.status_code, error.response.text
+    if isinstance(error, httpx.HTTPError):
+        return 502, f"Error connecting to upstream: {error}"
+    return 500, str(error)
+
+
+class JobStore:
+    """SQLite-backed job records, so accepted submissions and their outcomes survive restarts."""
+
+    def __init__(self, path):
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY, status TEXT NOT NULL, request TEXT NOT NULL,"
+                " status_code INTEGER, result TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def create(self, request_body):
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, request, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(request_body), now, now),
+            )
+        return job_id
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, status_code, result, created_at, updated_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, status, status_code, result, created_at, updated_at = row
+        return {
+            "jobId": job_id,
+            "status": status,
+            "statusCode": status_code,
+            "result": json.loads(result) if result is not None else None,
+            "createdAt": created_at,
+            "updatedAt": updated_at,
+        }
+
+    def request_body(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT request FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, job_id, status, status_code=None, result=None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, status_code = ?, result = ?, updated_at = ? WHERE id = ?",
+                (status, status_code, json.dumps(result) if result is not None else None, time.time(), job_id),
+            )
+
+    def unfinished(self):
+        """(job_id, status) of queued and running jobs, oldest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, status FROM jobs WHERE status IN (?, ?) ORDER BY created_at", (QUEUED, RUNNING)
+            ).fetchall()
+
+    def purge(self, older_than):
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?", (SUCCEEDED, FAILED, older_than)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """
+    Bounded worker pool running `handler(request_body, job_id)` for submitted jobs.
+
+    Jobs are recorded before they are queued, so on `start()` jobs left queued by a
+    previous process are picked up again. Jobs that were running when it stopped may
+    already have reached the upstream; they are only resumed when the upstream honors
+    idempotency keys (the handler is expected to use the job id as the key), and are
+    marked failed otherwise.
+    """
+
+    def __init__(self, handler, path=SERVICE_REQUEST_JOB_DB_PATH, workers=SERVICE_REQUEST_JOB_WORKERS,
+                 maxsize=SERVICE_REQUEST_JOB_QUEUE_SIZE, budget=SERVICE_REQUEST_JOB_BUDGET,
+                 retention=SERVICE_REQUEST_JOB_RETENTION, stop_grace=SERVICE_REQUEST_JOB_STOP_GRACE):
+        self.handler = handler
+        self.path = path
+        self.workers = workers
+        self.maxsize = maxsize
+        self.budget = budget
+        self.retention = retention
+        self.stop_grace = stop_grace
+        self.store = None
+        self._queue = None
+        self._tasks = []
+        self._busy = set()  # Workers running a job right now.
+        self._stopping = False
+        self._purged_at = 0
+
+    async def start(self):
+        self.store = JobStore(self.path)
+        self._queue = asyncio.Queue()
+        self._purge()
+        for job_id, status in self.store.unfinished():
+            if status == RUNNING and not UPSTREAM_HONORS_IDEMPOTENCY_KEYS:
+                self.store.update(job_id, FAILED, 500, {"detail": "Interrupted by a restart; resubmit if it is missing upstream"})
+                JOBS_FINISHED.labels(status=FAILED).inc()
+                continue
+            self._queue.put_nowait(job_id)
+        JOBS_QUEUED.set(self._queue.qsize())
+        self._stopping = False
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """
+        Stops the workers. Running jobs get `stop_grace` seconds to finish before they
+        are cancelled; queued jobs stay in the store for the next start.
+        """
+        self._stopping = True
+        for task in self._tasks:
+            if task not in self._busy:
+                task.cancel()
+        running = [task for task in self._tasks if task in self._busy]
+        if running:
+            _, pending = await asyncio.wait(running, timeout=self.stop_grace)
+            if pending:
+                logger.warning(f"Cancelling {len(pending)} service request job(s) still running after {self.stop_grace}s")
+            for task in pending:
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._busy.clear()
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def submit(self, request_body):
+        """Records and queues a job. Returns its id, or raises 503 when the queue is full."""
+        if self._queue is None:
+            raise HTTPException(status_code=503, detail="Job queue is not running")
+        if self._queue.qsize() >= self.maxsize:
+            raise HTTPException(status_code=503, detail="Too many queued submissions", headers={"Retry-After": "5"})
+        job_id = self.store.create(request_body)
+        self._queue.put_nowait(job_id)
+        JOBS_QUEUED.inc()
+        return job_id
+
+    def get(self, job_id):
+        return self.store.get(job_id) if self.store is not None else None
+
+    async def _work(self):
+        worker = asyncio.current_task()
+        while not self._stopping:
+            job_id = await self._queue.get()
+            JOBS_QUEUED.dec()
+            self._busy.add(worker)
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception(f"Service request job {job_id} could not be recorded")
+            finally:
+                self._busy.discard(worker)
+                self._queue.task_done()
+            self._purge()
+
+    async def _run(self, job_id):
+        request_body = self.store.request_body(job_id)
+        if request_body is None:
+            return
+        self.store.update(job_id, RUNNING)
+        try:
+            with request_deadline(self.budget):
+                result = await self.handler(request_body, job_id)
+        except Exception as e:
+            status_code, detail = failure_outcome(e)
+            if status_code == 500:
+                logger.exception(f"Service request job {job_id} failed")
+            status, result = FAILED, {"detail": detail}
+        else:
+            status, status_code = SUCCEEDED, 201
+        self.store.update(job_id, status, status_code, result)
+        JOBS_FINISHED.labels(status=status).inc()
+
+    def _purge(self):
+        now = time.time()
+        if now - self._purged_at >= PURGE_INTERVAL:
+            self._purged_at = now
+            self.store.purge(now - self.retention)
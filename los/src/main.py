@@ -1,9 +1,73 @@
-from fastapi import FastAPI
-from .api import router
+import time
+import httpx
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from .api import job_queue, router
+from .circuit_breaker import CircuitOpenError
+from .deadline import DeadlineExceeded, budget_for_path, request_deadline
+from .jobs import failure_outcome
+from .http_client import open_http_client, close_http_client
+from .metrics import CONTENT_TYPE, REGISTRY, REQUEST_LATENCY, REQUESTS_IN_FLIGHT, endpoint_label
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_http_client()
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    await close_http_client()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(router, prefix="/wrapper")
 
+
+@app.middleware("http")
+async def apply_request_deadline(request: Request, call_next):
+    with request_deadline(budget_for_path(request.url.path)):
+        return await call_next(request)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    REQUESTS_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        # Numeric IDs are collapsed and unrouted paths grouped so label values stay bounded.
+        route = endpoint_label(request.url.path) if "route" in request.scope else "unmatched"
+        REQUEST_LATENCY.labels(method=request.method, route=route, status=status).observe(time.perf_counter() - started)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": str(exc.retry_after)})
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+@app.exception_handler(httpx.HTTPError)
+async def upstream_error_handler(request: Request, exc: httpx.HTTPError):
+    # Same status and detail as the bulk and async job paths report for this failure.
+    status_code, detail = failure_outcome(exc)
+    return JSONResponse(status_code=status_code, content={"detail": detail})
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,204 @@
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class _Metric:
+    """A named metric with optional labels; values are kept per label combination."""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def labels(self, **labels):
+        return _Child(self, tuple(str(labels[name]) for name in self.labelnames))
+
+    def _key(self, key):
+        if key is None:
+            if self.labelnames:
+                raise ValueError(f"{self.name} requires labels {self.labelnames}")
+            return ()
+        return key
+
+    def _label_text(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key, value):
+        return [f"{self.name}{self._label_text(key)} {_format(value)}"]
+
+
+class _Child:
+    """A metric bound to one set of label values."""
+
+    __slots__ = ("_metric", "_key")
+
+    def __init__(self, metric, key):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount=1):
+        self._metric.inc(amount, _key=self._key)
+
+    def dec(self, amount=1):
+        self._metric.dec(amount, _key=self._key)
+
+    def set(self, value):
+        self._metric.set(value, _key=self._key)
+
+    def observe(self, value):
+        self._metric.observe(value, _key=self._key)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, amount=1, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, _key=None):
+        self.inc(-amount, _key=_key)
+
+    def set(self, value, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, _key=None):
+        key = self._key(_key)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self, key, value):
+        counts, total, count = value
+        lines = [
+            f"{self.name}_bucket{self._label_text(key, [('le', _format(bound))])} {count_}"
+            for bound, count_ in zip(self.buckets, counts)
+        ]
+        lines.append(f"{self.name}_bucket{self._label_text(key, [('le', '+Inf')])} {count}")
+        lines.append(f"{self.name}_sum{self._label_text(key)} {_format(total)}")
+        lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+
+    def render(self):
+        """The registry in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+REGISTRY = MetricsRegistry()
+
+# Incoming requests
+REQUEST_LATENCY = Histogram(
+    "facade_request_duration_seconds", "Time spent serving incoming requests.", ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge("facade_requests_in_flight", "Incoming requests currently being served.")
+
+# Upstream calls
+UPSTREAM_LATENCY = Histogram(
+    "upstream_request_duration_seconds", "Latency of upstream LOS calls per attempt.", ["endpoint", "method"]
+)
+UPSTREAM_REQUESTS = Counter(
+    "upstream_requests_total", "Upstream LOS call attempts by response status.", ["endpoint", "method", "status"]
+)
+UPSTREAM_IN_FLIGHT = Gauge("upstream_requests_in_flight", "Upstream LOS calls currently in flight.", ["endpoint"])
+UPSTREAM_RETRIES = Counter("upstream_retries_total", "Upstream calls retried, by reason.", ["endpoint", "reason"])
+UPSTREAM_RATE_LIMITED = Counter("upstream_rate_limited_total", "Upstream 429 responses.", ["endpoint"])
+TOKEN_REFRESHES = Counter("token_refreshes_total", "Access token fetches from the authentication server.", ["result"])
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache lookups by result.", ["cache", "result"])
+
+# Asynchronous service request jobs
+JOBS_QUEUED = Gauge("service_request_jobs_queued", "Service request jobs waiting for a worker.")
+JOBS_FINISHED = Counter("service_request_jobs_finished_total", "Service request jobs finished, by status.", ["status"])
+
+_ID_SEGMENT = re.compile(r"/(?:\d+|[0-9a-f]{32}|[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12})(?=/|$)")
+
+
+def endpoint_label(path):
+    """Path with numeric, hex and UUID IDs collapsed so each endpoint is one label value."""
+    return _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0])
+
+
+@contextmanager
+def track_upstream(endpoint, method):
+    """
+    Records latency, in-flight count and outcome of one upstream attempt.
+    Set `call["status"]` to the response status inside the block; it stays "error" otherwise.
+    """
+    UPSTREAM_IN_FLIGHT.labels(endpoint=endpoint).inc()
+    call = {"status": "error"}
+    started = time.perf_counter()
+    try:
+        yield call
+    finally:
+        UPSTREAM_IN_FLIGHT.labels(endpoint=endpoint).dec()
+        UPSTREAM_LATENCY.labels(endpoint=endpoint, method=method).observe(time.perf_counter() - started)
+        UPSTREAM_REQUESTS.labels(endpoint=endpoint, method=method, status=call["status"]).inc()
+        if call["status"] == 429:
+            UPSTREAM_RATE_LIMITED.labels(endpoint=endpoint).inc()
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import time
+from email.utils import parsedate_to_datetime
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; FileBackend is unusable there.
+    fcntl = None
+
+from .config import (
+    RATE_LIMIT_INITIAL_RATE,
+    RATE_LIMIT_MIN_RATE,
+    RATE_LIMIT_MAX_RATE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_INCREASE,
+    RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_STATE_PATH,
+)
+
+
+def parse_retry_after(value):
+    """Returns the Retry-After delay in seconds (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class InMemoryBackend:
+    """Keeps limiter state in this process only."""
+
+    def __init__(self):
+        self._state = {}
+
+    def transact(self, fn):
+        return fn(self._state)
+
+    async def atransact(self, fn):
+        return fn(self._state)
+
+
+class FileBackend:
+    """
+    Keeps limiter state in a small JSON file guarded by flock, so every worker
+    process on the host shares one bucket. Put the file on tmpfs (/dev/shm) to
+    keep each transaction in memory. `atransact` waits for the lock in a thread,
+    so contention with other workers never blocks the event loop.
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise RuntimeError("FileBackend requires fcntl (POSIX only)")
+        self.path = path
+
+    def transact(self, fn):
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                try:
+                    state = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    state = {}
+                result = fn(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    async def atransact(self, fn):
+        return await asyncio.to_thread(self.transact, fn)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose refill rate adapts to the upstream (AIMD).
+
+    The rate starts at `initial_rate`, by default `max_rate`, so callers are not held
+    back until the upstream pushes back. Successful responses raise the rate
+    additively (`increase` requests/s per second), a 429 multiplies it by
+    `decrease_factor` and pauses *all* callers sharing the backend until Retry-After
+    has passed. Rate-limit headers that report an exhausted
+    quota pause callers the same way before a 429 is ever returned.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        initial_rate=RATE_LIMIT_INITIAL_RATE,
+        min_rate=RATE_LIMIT_MIN_RATE,
+        max_rate=RATE_LIMIT_MAX_RATE,
+        burst=RATE_LIMIT_BURST,
+        increase=RATE_LIMIT_INCREASE,
+        decrease_factor=RATE_LIMIT_DECREASE_FACTOR,
+    ):
+        self.backend = backend or InMemoryBackend()
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+
+    async def acquire(self):
+        """Waits until a request may be sent."""
+        while True:
+            wait_time = await self.backend.atransact(self._take)
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+    async def on_success(self, headers=None):
+        await self.backend.atransact(self._increase)
+        if headers is not None:
+            await self.observe_headers(headers)
+
+    async def on_rate_limited(self, retry_after=None):
+        """Records a 429. Returns how long callers will now be paused."""
+        delay = retry_after if retry_after is not None else 1.0 / self.min_rate
+        return await self.backend.atransact(lambda state: self._decrease(state, delay))
+
+    async def observe_headers(self, headers):
+        remaining = headers.get("RateLimit-Remaining") or headers.get("X-RateLimit-Remaining")
+        reset = headers.get("RateLimit-Reset") or headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return
+        if remaining <= 0:
+            # Some APIs send an epoch timestamp rather than seconds until the reset.
+            delay = reset - time.time() if reset > 10 ** 9 else reset
+            await self.backend.atransact(lambda state: self._pause(state, time.time() + max(delay, 0.0)))
+
+    def stats(self):
+        return self.backend.transact(lambda state: dict(self._refill(state)))
+
+    def _refill(self, state):
+        now = time.time()
+        if "rate" not in state:
+            state.update(rate=self.initial_rate, tokens=self.burst, updated_at=now, increased_at=now)
+            state.setdefault("paused_until", 0)
+        elapsed = max(now - state["updated_at"], 0.0)
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * state["rate"])
+        state["updated_at"] = now
+        return state
+
+    def _take(self, state):
+        state = self._refill(state)
+        paused_for = state["paused_until"] - state["updated_at"]
+        if paused_for > 0:
+            return paused_for
+        if state["tokens"] >= 1:
+            state["tokens"] -= 1
+            return 0
+        return (1 - state["tokens"]) / state["rate"]
+
+    def _increase(self, state):
+        state = self._refill(state)
+        elapsed = max(state["updated_at"] - state["increased_at"], 0.0)
+        state["rate"] = min(self.max_rate, state["rate"] + self.increase * elapsed)
+        state["increased_at"] = state["updated_at"]
+
+    def _decrease(self, state, delay):
+        state = self._refill(state)
+        state["rate"] = max(self.min_rate, state["rate"] * self.decrease_factor)
+        state["tokens"] = 0
+        state["increased_at"] = state["updated_at"] + delay
+        self._pause(state, state["updated_at"] + delay)
+        return state["paused_until"] - state["updated_at"]
+
+    @staticmethod
+    def _pause(state, until):
+        state["paused_until"] = max(state.get("paused_until", 0), until)
+
+
+def build_rate_limiter(state_path=RATE_LIMIT_STATE_PATH):
+    backend = FileBackend(state_path) if state_path else InMemoryBackend()
+    return AdaptiveRateLimiter(backend)
+
+
+rate_limiter = build_rate_limiter()
@@ -0,0 +1,117 @@
+import random
+import time
+import uuid
+import httpx
+from .config import (
+    MAX_RETRIES,
+    BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRYABLE_STATUS_CODES,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_MIN_PER_SECOND,
+    RETRY_BUDGET_MAX_TOKENS,
+    UPSTREAM_HONORS_IDEMPOTENCY_KEYS,
+)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENCY_KEY_METHODS = frozenset({"POST", "PATCH"})
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Errors raised before the request could have reached the upstream, safe to retry for any method.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryBudget:
+    """
+    Per-process cap on retries relative to traffic.
+
+    Every request deposits `ratio` tokens and every retry withdraws one, with a
+    floor of `min_per_second` retries per second. When the upstream is failing
+    wholesale the budget drains and requests fail instead of multiplying load.
+    """
+
+    def __init__(self, ratio=RETRY_BUDGET_RATIO, min_per_second=RETRY_BUDGET_MIN_PER_SECOND, max_tokens=RETRY_BUDGET_MAX_TOKENS):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.exhausted = 0
+        self._updated_at = time.monotonic()
+
+    def record_request(self):
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self):
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed upstream call is retried.
+
+    Backoff uses full jitter (uniform between 0 and the exponential cap) so
+    workers that failed together do not retry together. Non-idempotent methods
+    are only retried when the request provably never reached the upstream, when
+    it was rate limited, or when the upstream is known to honor idempotency keys.
+    """
+
+    def __init__(
+        self,
+        max_retries=MAX_RETRIES,
+        base_delay=BASE_DELAY,
+        max_delay=RETRY_MAX_DELAY,
+        retryable_status_codes=RETRYABLE_STATUS_CODES,
+        budget=None,
+        honors_idempotency_keys=UPSTREAM_HONORS_IDEMPOTENCY_KEYS,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.budget = budget or RetryBudget()
+        self.honors_idempotency_keys = honors_idempotency_keys
+
+    def prepare_headers(self, method, headers):
+        """Adds an idempotency key to POST/PATCH requests; it is reused across retries of the call."""
+        if method in IDEMPOTENCY_KEY_METHODS and IDEMPOTENCY_KEY_HEADER not in headers:
+            headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
+        return headers
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def is_retryable(self, method, headers, response=None, error=None):
+        if response is not None:
+            if response.status_code == 429:
+                return True  # Rejected before processing, whatever the method.
+            if response.status_code not in self.retryable_status_codes:
+                return False
+        elif isinstance(error, NOT_SENT_ERRORS):
+            return True
+        elif not isinstance(error, httpx.RequestError):
+            return False
+
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return self.honors_idempotency_keys and IDEMPOTENCY_KEY_HEADER in headers
+
+    def should_retry(self, attempt, method, headers, response=None, error=None):
+        if attempt + 1 >= self.max_retries:
+            return False
+        if not self.is_retryable(method, headers, response=response, error=error):
+            return False
+        return self.budget.try_withdraw()
+
+
+retry_policy = RetryPolicy()
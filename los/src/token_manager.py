@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import time
+from .deadline import create_background_task
+
+logger = logging.getLogger(__name__)
+
+
+class CachedToken:
+    __slots__ = ("access_token", "refresh_at", "expires_at")
+
+    def __init__(self, access_token, refresh_at, expires_at):
+        self.access_token = access_token
+        self.refresh_at = refresh_at
+        self.expires_at = expires_at
+
+
+class TokenManager:
+    """
+    Caches access tokens per (client_id, scope).
+
+    `fetch_token(client_id, scope)` is a coroutine returning `(access_token, expires_in)`.
+    Tokens inside the refresh margin are served while a background task renews them,
+    and concurrent callers without a usable token await one shared fetch.
+    """
+
+    def __init__(self, fetch_token, refresh_margin=60, default_expires_in=300):
+        self._fetch_token = fetch_token
+        self._refresh_margin = refresh_margin
+        self._default_expires_in = default_expires_in
+        self._tokens = {}
+        self._locks = {}
+        self._refresh_tasks = {}
+
+    async def get_token(self, client_id, scope=None):
+        key = (client_id, scope)
+        cached = self._tokens.get(key)
+        now = time.monotonic()
+        if cached and now < cached.expires_at:
+            if now >= cached.refresh_at:
+                self._refresh_in_background(key)
+            return cached.access_token
+
+        async with self._lock_for(key):
+            # Another caller may have refreshed the token while we waited.
+            cached = self._tokens.get(key)
+            if cached and time.monotonic() < cached.expires_at:
+                return cached.access_token
+            return await self._refresh(key)
+
+    def invalidate(self, client_id, scope=None):
+        self._tokens.pop((client_id, scope), None)
+
+    def _lock_for(self, key):
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    async def _refresh(self, key):
+        access_token, expires_in = await self._fetch_token(*key)
+        if not access_token:
+            return None
+        expires_in = int(expires_in or self._default_expires_in)
+        now = time.monotonic()
+        # Short-lived tokens are refreshed half way through instead of never.
+        refresh_in = max(expires_in - self._refresh_margin, expires_in / 2)
+        self._tokens[key] = CachedToken(access_token, now + refresh_in, now + expires_in)
+        return access_token
+
+    def _refresh_in_background(self, key):
+        task = self._refresh_tasks.get(key)
+        if task and not task.done():
+            return
+        # Not bound by the deadline of whichever request noticed the token was due.
+        self._refresh_tasks[key] = create_background_task(self._background_refresh(key))
+
+    async def _background_refresh(self, key):
+        async with self._lock_for(key):
+            try:
+                await self._refresh(key)
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
@@ -0,0 +1,387 @@
+import hashlib
+import json
+import math
+import re
+
+MAX_COMPILED_VALIDATORS = 8
+
+# fingerprint -> compiled request validator
+_compiled_validators = {}
+# (schema object, validator) for the schema most recently seen, so unchanged cache entries skip hashing
+_last_compiled = (None, None)
+
+JSON_TYPES = {
+    "null": lambda v: v is None,
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: (isinstance(v, int) and not isinstance(v, bool)) or (isinstance(v, float) and v.is_integer()),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "string": lambda v: isinstance(v, str),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+
+
+def schema_fingerprint(schema):
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_request_validator(schema):
+    """
+    Returns the validator for service request bodies described by `schema`.
+
+    Validators are compiled once per schema fingerprint; while the schema cache keeps
+    returning the same object not even the fingerprint is recomputed.
+    """
+    global _last_compiled
+    if _last_compiled[0] is schema:
+        return _last_compiled[1]
+
+    fingerprint = schema_fingerprint(schema)
+    validator = _compiled_validators.get(fingerprint)
+    if validator is None:
+        if len(_compiled_validators) >= MAX_COMPILED_VALIDATORS:
+            _compiled_validators.clear()
+        validator = _compiled_validators[fingerprint] = SchemaValidator(schema)
+    _last_compiled = (schema, validator)
+    return validator
+
+
+def json_pointer(loc):
+    """RFC 6901 pointer for a location path, e.g. ("data", "collaterals", 0) -> "/data/collaterals/0"."""
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in loc)
+
+
+def schema_error(loc, msg, keyword):
+    """An error in the shape used across the API: Pydantic-style `loc`/`msg`/`type` plus a JSON pointer."""
+    return {"loc": list(loc), "pointer": json_pointer(loc), "msg": msg, "type": f"jsonschema.{keyword}"}
+
+
+class SchemaValidator:
+    """
+    A JSON schema compiled into nested check functions.
+
+    Keywords are resolved once at compile time (patterns compiled, local $refs bound),
+    so validating a body is a walk over the data. Every violation is reported, not just
+    the first. Supports the validation keywords of drafts 4-7 except `format`,
+    `dependencies` and `if`/`then`/`else`, which are not enforced.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._refs = {}
+        self._check = self._compile(schema)
+
+    def __call__(self, instance):
+        """Returns the list of errors for `instance`; empty when it is valid."""
+        errors = []
+        self._check(instance, (), errors)
+        return errors
+
+    def _compile(self, schema):
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return lambda value, loc, errors: errors.append(schema_error(loc, "No value is allowed here", "false"))
+        if "$ref" in schema:
+            return self._compile_ref(schema["$ref"])
+
+        type_check = _compile_type(schema.get("type"))
+        checks = []
+        for compile_keyword in (_compile_enum, _compile_string, _compile_number):
+            check = compile_keyword(schema)
+            if check:
+                checks.append(check)
+        checks.extend(self._compile_array(schema))
+        checks.extend(self._compile_object(schema))
+        checks.extend(self._compile_combinators(schema))
+
+        def check_node(value, loc, errors):
+            if type_check and not type_check(value, loc, errors):
+                return  # Other keywords would only repeat the type error.
+            for check in checks:
+                check(value, loc, errors)
+
+        return check_node
+
+    def _compile_ref(self, ref):
+        # Bound lazily through self._refs so recursive schemas compile.
+        if ref not in self._refs:
+            self._refs[ref] = None
+            self._refs[ref] = self._compile(_resolve_ref(ref, self.schema))
+
+        def check_ref(value, loc, errors):
+            self._refs[ref](value, loc, errors)
+
+        return check_ref
+
+    def _compile_array(self, schema):
+        checks = []
+        items = schema.get("items")
+        if isinstance(items, list):
+            item_checks = [self._compile(item) for item in items]
+            additional = schema.get("additionalItems", True)
+            additional_check = self._compile(additional) if additional is not True else None
+
+            def check_tuple_items(value, loc, errors):
+                if isinstance(value, list):
+                    for i, item in enumerate(value):
+                        if i < len(item_checks):
+                            item_checks[i](item, loc + (i,), errors)
+                        elif additional_check:
+                            additional_check(item, loc + (i,), errors)
+
+            checks.append(check_tuple_items)
+        elif items is not None and items is not True and items != {}:
+            item_check = self._compile(items)
+
+            def check_items(value, loc, errors):
+                if isinstance(value, list):
+                    for i, item in enumerate(value):
+                        item_check(item, loc + (i,), errors)
+
+            checks.append(check_items)
+
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+        unique = schema.get("uniqueItems", False)
+        if min_items is not None or max_items is not None or unique:
+            def check_array_size(value, loc, errors):
+                if not isinstance(value, list):
+                    return
+                if min_items is not None and len(value) < min_items:
+                    errors.append(schema_error(loc, f"Should have at least {min_items} items", "minItems"))
+                if max_items is not None and len(value) > max_items:
+                    errors.append(schema_error(loc, f"Should have at most {max_items} items", "maxItems"))
+                if unique:
+                    seen = set()
+                    for item in value:
+                        key = json_key(item)
+                        if key in seen:
+                            errors.append(schema_error(loc, "Items should be unique", "uniqueItems"))
+                            break
+                        seen.add(key)
+
+            checks.append(check_array_size)
+        return checks
+
+    def _compile_object(self, schema):
+        checks = []
+        required = schema.get("required") or []
+        if required:
+            def check_required(value, loc, errors):
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            errors.append(schema_error(loc + (name,), "Field required", "required"))
+
+            checks.append(check_required)
+
+        properties = {name: self._compile(sub) for name, sub in (schema.get("properties") or {}).items()}
+        patterns = [(re.compile(p), self._compile(sub)) for p, sub in (schema.get("patternProperties") or {}).items()]
+        additional = schema.get("additionalProperties", True)
+        additional_check = self._compile(additional) if additional is not True else None
+        if properties or patterns or additional_check:
+            def check_properties(value, loc, errors):
+                if not isinstance(value, dict):
+                    return
+                for name, item in value.items():
+                    matched = False
+                    check = properties.get(name)
+                    if check:
+                        matched = True
+                        check(item, loc + (name,), errors)
+                    for pattern, pattern_check in patterns:
+                        if pattern.search(name):
+                            matched = True
+                            pattern_check(item, loc + (name,), errors)
+                    if not matched and additional_check:
+                        if additional is False:
+                            errors.append(schema_error(loc + (name,), "Extra fields not permitted", "additionalProperties"))
+                        else:
+                            additional_check(item, loc + (name,), errors)
+
+            checks.append(check_properties)
+
+        min_properties, max_properties = schema.get("minProperties"), schema.get("maxProperties")
+        if min_properties is not None or max_properties is not None:
+            def check_object_size(value, loc, errors):
+                if not isinstance(value, dict):
+                    return
+                if min_properties is not None and len(value) < min_properties:
+                    errors.append(schema_error(loc, f"Should have at least {min_properties} properties", "minProperties"))
+                if max_properties is not None and len(value) > max_properties:
+                    errors.append(schema_error(loc, f"Should have at most {max_properties} properties", "maxProperties"))
+
+            checks.append(check_object_size)
+        return checks
+
+    def _compile_combinators(self, schema):
+        checks = []
+        if "allOf" in schema:
+            all_of = [self._compile(sub) for sub in schema["allOf"]]
+
+            def check_all_of(value, loc, errors):
+                for check in all_of:
+                    check(value, loc, errors)
+
+            checks.append(check_all_of)
+
+        if "anyOf" in schema:
+            any_of = [self._compile(sub) for sub in schema["anyOf"]]
+
+            def check_any_of(value, loc, errors):
+                if not any(_passes(check, value, loc) for check in any_of):
+                    errors.append(schema_error(loc, "Does not match any of the allowed schemas", "anyOf"))
+
+            checks.append(check_any_of)
+
+        if "oneOf" in schema:
+            one_of = [self._compile(sub) for sub in schema["oneOf"]]
+
+            def check_one_of(value, loc, errors):
+                matches = sum(_passes(check, value, loc) for check in one_of)
+                if matches != 1:
+                    errors.append(schema_error(loc, f"Should match exactly one allowed schema, matched {matches}", "oneOf"))
+
+            checks.append(check_one_of)
+
+        if "not" in schema:
+            not_check = self._compile(schema["not"])
+
+            def check_not(value, loc, errors):
+                if _passes(not_check, value, loc):
+                    errors.append(schema_error(loc, "Matches a schema that is not allowed", "not"))
+
+            checks.append(check_not)
+        return checks
+
+
+def json_key(value):
+    """
+    A hashable key that compares like JSON values do: 1 and 1.0 are the same number,
+    while True and 1 (equal in Python) are not. Raises TypeError for non-JSON values.
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return type(value).__name__, value
+    if isinstance(value, (int, float)):
+        return "number", value
+    if isinstance(value, list):
+        return "array", tuple(json_key(item) for item in value)
+    if isinstance(value, dict):
+        return "object", frozenset((name, json_key(item)) for name, item in value.items())
+    raise TypeError(f"Not a JSON value: {value!r}")
+
+
+def _accept(value, loc, errors):
+    pass
+
+
+def _passes(check, value, loc):
+    errors = []
+    check(value, loc, errors)
+    return not errors
+
+
+def _compile_type(schema_type):
+    if schema_type is None:
+        return None
+    types = schema_type if isinstance(schema_type, list) else [schema_type]
+    predicates = [JSON_TYPES[t] for t in types if t in JSON_TYPES]
+    if not predicates:
+        return None
+    expected = " or ".join(types)
+
+    def check_type(value, loc, errors):
+        if any(predicate(value) for predicate in predicates):
+            return True
+        errors.append(schema_error(loc, f"Input should be of type {expected}", "type"))
+        return False
+
+    return check_type
+
+
+def _compile_enum(schema):
+    if "const" in schema:
+        allowed = [schema["const"]]
+        keyword = "const"
+    elif "enum" in schema:
+        allowed = list(schema["enum"])
+        keyword = "enum"
+    else:
+        return None
+    allowed_keys = {json_key(v) for v in allowed}
+    listed = ", ".join(json.dumps(v) for v in allowed)
+
+    def check_enum(value, loc, errors):
+        try:
+            key = json_key(value)
+        except TypeError:
+            key = None
+        if key not in allowed_keys:
+            errors.append(schema_error(loc, f"Input should be one of {listed}", keyword))
+
+    return check_enum
+
+
+def _compile_string(schema):
+    min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    if min_length is None and max_length is None and pattern is None:
+        return None
+
+    def check_string(value, loc, errors):
+        if not isinstance(value, str):
+            return
+        if min_length is not None and len(value) < min_length:
+            errors.append(schema_error(loc, f"String should have at least {min_length} characters", "minLength"))
+        if max_length is not None and len(value) > max_length:
+            errors.append(schema_error(loc, f"String should have at most {max_length} characters", "maxLength"))
+        if pattern is not None and not pattern.search(value):
+            errors.append(schema_error(loc, f"String should match pattern '{pattern.pattern}'", "pattern"))
+
+    return check_string
+
+
+def _compile_number(schema):
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    exclusive_minimum, exclusive_maximum = schema.get("exclusiveMinimum"), schema.get("exclusiveMaximum")
+    # Draft 4 spells exclusive bounds as booleans next to minimum/maximum.
+    if exclusive_minimum is True:
+        exclusive_minimum, minimum = minimum, None
+    elif exclusive_minimum is False:
+        exclusive_minimum = None
+    if exclusive_maximum is True:
+        exclusive_maximum, maximum = maximum, None
+    elif exclusive_maximum is False:
+        exclusive_maximum = None
+    multiple_of = schema.get("multipleOf")
+    if all(bound is None for bound in (minimum, maximum, exclusive_minimum, exclusive_maximum, multiple_of)):
+        return None
+
+    def check_number(value, loc, errors):
+        if not JSON_TYPES["number"](value):
+            return
+        if minimum is not None and value < minimum:
+            errors.append(schema_error(loc, f"Input should be greater than or equal to {minimum}", "minimum"))
+        if exclusive_minimum is not None and value <= exclusive_minimum:
+            errors.append(schema_error(loc, f"Input should be greater than {exclusive_minimum}", "exclusiveMinimum"))
+        if maximum is not None and value > maximum:
+            errors.append(schema_error(loc, f"Input should be less than or equal to {maximum}", "maximum"))
+        if exclusive_maximum is not None and value >= exclusive_maximum:
+            errors.append(schema_error(loc, f"Input should be less than {exclusive_maximum}", "exclusiveMaximum"))
+        if multiple_of is not None:
+            quotient = value / multiple_of
+            if not math.isclose(quotient, round(quotient), rel_tol=0, abs_tol=1e-9):
+                errors.append(schema_error(loc, f"Input should be a multiple of {multiple_of}", "multipleOf"))
+
+    return check_number
+
+
+def _resolve_ref(ref, root):
+    # Only local refs can be resolved; anything else, like a dangling ref, accepts any value.
+    if not ref.startswith("#"):
+        return {}
+    node = root
+    for part in ref[1:].lstrip("/").split("/") if ref != "#" else []:
+        node = node.get(part.replace("~1", "/").replace("~0", "~"), {}) if isinstance(node, dict) else {}
+    return node
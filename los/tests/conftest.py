@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app is imported as the `src` package from the los directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,72 @@
+import pytest
+
+from src.validation import SchemaValidator, json_key
+
+
+def error_types(schema, instance):
+    return [error["type"] for error in SchemaValidator(schema)(instance)]
+
+
+OBJECT_SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string"},
+        "nickname": {"type": "string"},
+        "note": {"type": ["string", "null"]},
+        "anything": {},
+    },
+}
+
+
+def test_null_rejected_for_optional_property_that_does_not_allow_it():
+    assert error_types(OBJECT_SCHEMA, {"name": "a", "nickname": None}) == ["jsonschema.type"]
+
+
+def test_null_rejected_for_required_property_that_does_not_allow_it():
+    assert error_types(OBJECT_SCHEMA, {"name": None}) == ["jsonschema.type"]
+
+
+@pytest.mark.parametrize("name", ["note", "anything"])
+def test_null_accepted_where_the_property_schema_allows_it(name):
+    assert error_types(OBJECT_SCHEMA, {"name": "a", name: None}) == []
+
+
+def test_missing_optional_property_is_accepted():
+    assert error_types(OBJECT_SCHEMA, {"name": "a"}) == []
+
+
+@pytest.mark.parametrize("allowed, value", [
+    ([1, 2], 1.0),
+    ([1.0, 2.5], 1),
+    ([[1, {"a": 2}]], [1.0, {"a": 2.0}]),
+])
+def test_enum_treats_equal_numbers_as_equal(allowed, value):
+    assert error_types({"enum": allowed}, value) == []
+
+
+@pytest.mark.parametrize("allowed, value", [
+    ([1], True),
+    ([True], 1),
+    ([0], False),
+    (["1"], 1),
+    ([None], 0),
+])
+def test_enum_keeps_json_types_apart(allowed, value):
+    assert error_types({"enum": allowed}, value) == ["jsonschema.enum"]
+
+
+def test_const_treats_equal_numbers_as_equal():
+    assert error_types({"const": 3}, 3.0) == []
+    assert error_types({"const": 3}, 3.5) == ["jsonschema.const"]
+
+
+def test_unique_items_treats_equal_numbers_as_duplicates():
+    schema = {"type": "array", "uniqueItems": True}
+    assert error_types(schema, [1, 1.0]) == ["jsonschema.uniqueItems"]
+    assert error_types(schema, [1, True]) == []
+
+
+def test_json_key_rejects_non_json_values():
+    with pytest.raises(TypeError):
+        json_key(object())